@@ -23,16 +23,16 @@ import os
 import re
 import ssl
 import uuid
-import time
 import random
 import pickle
 import asyncio
 import logging
 import socket
+import tempfile
 import ipaddress
 import traceback
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, lru_cache, partial
 from platformdirs import user_data_dir
 from dataclasses import dataclass, field
 from typing import (
@@ -54,6 +54,7 @@ except ImportError as e:
     logging.warning(f"Failed to import CertificateAuthority: {e}")
 
 from chaski.utils.debug import styled_logger
+from chaski.utils.inproc import open_inproc_connection, start_inproc_server
 
 # Initialize loggers for the main node operations, edge connections, and UDP protocol
 logger_main = styled_logger(logging.getLogger("ChaskiNode"))
@@ -77,6 +78,29 @@ IGNORE_LOGS_FOR_COMMANDS = [
 ]
 
 
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _ping_payload(size: int) -> bytes:
+    """
+    Return a zero-filled dummy payload of the given size.
+
+    Ping payloads only simulate message size, so their content is irrelevant.
+    Caching them by size avoids allocating and filling a new buffer on every
+    ping, which matters for large payloads sent repeatedly.
+
+    Parameters
+    ----------
+    size : int
+        The size of the payload in bytes.
+
+    Returns
+    -------
+    bytes
+        An immutable buffer of `size` zero bytes.
+    """
+    return bytes(size)
+
+
 ########################################################################
 class MessagesPool:
     """
@@ -183,6 +207,8 @@ class Edge:
         A flag to indicate if a ping operation is in progress, default is False.
     paired : bool, optional
         A flag to indicate if the node is paired, default is False.
+    latency_updated : asyncio.Event
+        Event set every time a pong message updates the latency of the edge.
     """
 
     writer: asyncio.StreamWriter
@@ -195,6 +221,9 @@ class Edge:
     subscriptions: set = field(default_factory=set)
     ping_in_progress: bool = False
     paired: bool = False
+    latency_updated: asyncio.Event = field(
+        default_factory=asyncio.Event, repr=False, compare=False
+    )
 
     # ----------------------------------------------------------------------
     def __repr__(self) -> str:
@@ -439,7 +468,9 @@ class ChaskiNode:
         self,
         ip: str = '127.0.0.1',
         port: int = 0,
-        serializer: Callable[[Any], bytes] = pickle.dumps,
+        serializer: Callable[[Any], bytes] = partial(
+            pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL
+        ),
         deserializer: Callable[[bytes], Any] = pickle.loads,
         name: Optional[str] = None,
         subscriptions: Union[str, List[str]] = [],
@@ -456,6 +487,10 @@ class ChaskiNode:
         ssl_certificate_attributes: Optional[dict] = {},
         ssl_certificates_location: Optional[str] = None,
         request_ssl_certificate: Optional[str] = None,
+        request_ssl_certificate_timeout: Optional[float] = 10,
+        ssl_certificate_cache_ttl: Optional[float] = None,
+        transport: Literal['tcp', 'inproc', 'unix'] = 'tcp',
+        write_buffer_limit: Optional[int] = None,
     ) -> None:
         """
         Represent a ChaskiNode, which handles various network operations and manages connections.
@@ -473,7 +508,8 @@ class ChaskiNode:
         ip : int
             The port number to listen on or bind to.
         serializer : Callable[[Any], bytes], optional
-            The function to serialize data before sending it over the network. Defaults to `pickle.dumps`.
+            The function to serialize data before sending it over the network. Defaults to `pickle.dumps`
+            with the highest available protocol, the most compact and fastest pickle encoding.
         deserializer : Callable[[bytes], Any], optional
             The function to deserialize received data. Defaults to `pickle.loads`.
         name : Optional[str], optional
@@ -507,6 +543,26 @@ class ChaskiNode:
             Location of the directory where SSL/TLS certificates are stored.
             This directory should include the necessary certificate files for establishing secure
             connections using the configured SSL context. If not specified, defaults to the current directory ('.').
+        request_ssl_certificate_timeout : Optional[float], optional
+            Maximum time in seconds to wait for the connection with the Certificate Authority,
+            and then for the signed certificates, when requesting an SSL certificate. An
+            unreachable or unresponsive address fails fast instead of waiting for the operating
+            system TCP timeout, or forever. Use `None` to wait indefinitely. Defaults to `10`.
+        ssl_certificate_cache_ttl : Optional[float], optional
+            If set, certificates requested from a Certificate Authority are stored under the
+            node name and reused by nodes with the same name for this number of seconds,
+            skipping the signing request. Defaults to `None`, a new certificate is always requested.
+        transport : Literal['tcp', 'inproc', 'unix'], optional
+            The transport used for the node streams. 'tcp' uses regular TCP sockets, 'inproc' uses
+            in-memory streams that only reach nodes running in the same process, SSL contexts are
+            ignored. 'unix' uses Unix domain sockets in the temporary directory, named after the
+            node address, that reach nodes on the same host without the TCP stack. The UDP server
+            is used in all cases. Defaults to 'tcp'.
+        write_buffer_limit : Optional[int], optional
+            The high-water mark, in bytes, of the write buffer of every edge stream. With `0`
+            each `drain` waits until the transport has handed all the data to the socket, so
+            large transfers do not pile up in a user-space buffer. Defaults to `None`, the
+            asyncio default limits.
 
         Notes
         -----
@@ -539,6 +595,10 @@ class ChaskiNode:
         self.message_propagation = message_propagation
         self.ssl_context_client = ssl_context_client
         self.ssl_context_server = ssl_context_server
+        self.request_ssl_certificate_timeout = request_ssl_certificate_timeout
+        self.ssl_certificate_cache_ttl = ssl_certificate_cache_ttl
+        self.transport = transport
+        self.write_buffer_limit = write_buffer_limit
 
         if ssl_certificates_location is None:
             self.ssl_certificates_location = os.path.join(
@@ -574,6 +634,17 @@ class ChaskiNode:
         self.synchronous_udp_events = {}
         self.reconnecting = asyncio.Event()
 
+        # Event set every time a new edge completes the handshake and is registered
+        self.connected_event = asyncio.Event()
+
+        # Event set every time closed edges are removed from the edge list
+        self.disconnected_event = asyncio.Event()
+
+        # Event set while the TCP and UDP servers are bound and accepting connections,
+        # `server_closing` is False from the start of `run` until `stop`
+        self.serving_event = asyncio.Event()
+        self.server_closing = True
+
         # Initialize paired_event dictionary with asyncio Events for each subscription
         self.paired_event = {}
         for subscription in subscriptions:
@@ -741,6 +812,7 @@ class ChaskiNode:
 
         """
         self.server_closing = True
+        self.serving_event.clear()
 
         # Close all connections gracefully
         for edge in self.edges:
@@ -762,6 +834,13 @@ class ChaskiNode:
             except asyncio.TimeoutError:
                 logger_main.warning("Timeout waiting for server to close.")
 
+        # Remove the socket file left by the Unix domain socket server
+        if self.transport == 'unix':
+            try:
+                os.unlink(self._unix_path(self.ip, self.port))
+            except FileNotFoundError:
+                pass
+
     # ----------------------------------------------------------------------
     async def _connect_to_peer(
         self,
@@ -814,14 +893,26 @@ class ChaskiNode:
             raise ValueError(f"Cannot resolve address: {self.ip}")
         family, socktype, proto, canonname, sockaddr = addr_info[0]
 
-        # Establish a TCP connection to the peer node
-        reader, writer = await asyncio.open_connection(
-            peer_ip,
-            peer_port,
-            family=family,
-            ssl=self.ssl_context_client,
-        )
+        # Establish a TCP, in-process, or Unix domain socket connection to the peer node
+        if self.transport == 'inproc':
+            reader, writer = await open_inproc_connection(
+                peer_ip, peer_port, local_ip=self.ip
+            )
+        elif self.transport == 'unix':
+            reader, writer = await asyncio.open_unix_connection(
+                self._unix_path(peer_ip, peer_port),
+                ssl=self.ssl_context_client,
+                server_hostname=peer_ip if self.ssl_context_client else None,
+            )
+        else:
+            reader, writer = await asyncio.open_connection(
+                peer_ip,
+                peer_port,
+                family=family,
+                ssl=self.ssl_context_client,
+            )
 
+        self._set_write_buffer_limit(writer)
         edge = Edge(writer=writer, reader=reader)
 
         # Check if the connection should be marked as paired
@@ -946,6 +1037,97 @@ class ChaskiNode:
 
         return await self._connect_to_peer(ip, port)
 
+    # ----------------------------------------------------------------------
+    async def wait_connected(
+        self,
+        peer: Optional['ChaskiNode'] = None,
+        timeout: Optional[float] = 5,
+    ) -> Edge:
+        """
+        Wait until the handshake with a peer node has registered its edge.
+
+        Replaces fixed sleeps after `connect` by waiting on `connected_event`,
+        which is set every time a handshake back registers a new edge.
+
+        Parameters
+        ----------
+        peer : Optional[ChaskiNode]
+            The node whose edge is awaited, matched by its ip and port. If None,
+            the first registered edge is returned.
+        timeout : Optional[float]
+            Maximum time in seconds to wait. None waits indefinitely.
+
+        Returns
+        -------
+        Edge
+            The edge connected to `peer`.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the edge is not registered within `timeout` seconds.
+        """
+
+        def find_edge() -> Optional[Edge]:
+            for edge in self.edges:
+                if peer is None or (edge.ip, edge.port) == (peer.ip, peer.port):
+                    return edge
+
+        async def wait_edge() -> Edge:
+            while (edge := find_edge()) is None:
+                self.connected_event.clear()
+                await self.connected_event.wait()
+            return edge
+
+        return await asyncio.wait_for(wait_edge(), timeout)
+
+    # ----------------------------------------------------------------------
+    async def wait_disconnected(
+        self,
+        peer: 'ChaskiNode',
+        timeout: Optional[float] = 5,
+    ) -> None:
+        """
+        Wait until no edge with a peer node remains.
+
+        The counterpart of `wait_connected`, waits on `disconnected_event`, which
+        is set every time closed edges are removed from the edge list.
+
+        Parameters
+        ----------
+        peer : ChaskiNode
+            The node whose edge is expected to close, matched by its ip and port.
+        timeout : Optional[float]
+            Maximum time in seconds to wait. None waits indefinitely.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If an edge with `peer` remains after `timeout` seconds.
+        """
+
+        async def wait_edge_removed() -> None:
+            while self.is_connected_to(peer):
+                self.disconnected_event.clear()
+                await self.disconnected_event.wait()
+
+        await asyncio.wait_for(wait_edge_removed(), timeout)
+
+    # ----------------------------------------------------------------------
+    async def drain(self) -> None:
+        """
+        Wait until the data written to every edge has been flushed.
+
+        Awaits `drain` on the writer of each open edge so no frames remain
+        buffered in the transports before the node is stopped.
+        """
+        for edge in self.edges.copy():
+            if not edge.writer.is_closing():
+                try:
+                    await edge.writer.drain()
+                except ConnectionError:
+                    pass
+
     # ----------------------------------------------------------------------
     async def discovery(
         self,
@@ -1027,13 +1209,12 @@ class ChaskiNode:
                 edge=node,
             )
 
-            # Start a timer for the discovery process
-            t0 = time.time()
-            while time.time() < t0 + timeout:
-                await asyncio.sleep(0.1)
-                if self.paired_event[subscription].is_set():
-                    break
-            if time.time() > t0 + timeout:
+            # Wait for the pairing, the timeout is measured with the event loop clock
+            try:
+                await asyncio.wait_for(
+                    self.paired_event[subscription].wait(), timeout=timeout
+                )
+            except asyncio.TimeoutError:
                 logger_main.debug(
                     f"{self.name}: Timeout reached during discovery process for subscription {subscription}, node is considered paired."
                 )
@@ -1100,6 +1281,7 @@ class ChaskiNode:
             # Remove the closed connection from the edge list
             async with self.lock:
                 self.edges = [edge_ for edge_ in self.edges if edge_ != edge]
+            self.disconnected_event.set()
 
             logger_main.debug(
                 f"{self.name}: Connection to {edge} has been closed and removed."
@@ -1151,6 +1333,19 @@ class ChaskiNode:
             if edge_.name == node_name:
                 return edge_
 
+    # ----------------------------------------------------------------------
+    def _set_write_buffer_limit(self, writer: asyncio.StreamWriter) -> None:
+        """
+        Apply `write_buffer_limit` to the transport of a new edge stream.
+
+        Parameters
+        ----------
+        writer : asyncio.StreamWriter
+            The stream writer of the new connection.
+        """
+        if self.write_buffer_limit is not None:
+            writer.transport.set_write_buffer_limits(high=self.write_buffer_limit)
+
     # ----------------------------------------------------------------------
     async def _connected(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
@@ -1168,6 +1363,7 @@ class ChaskiNode:
         writer : asyncio.StreamWriter
             The StreamWriter object to write data to the connection.
         """
+        self._set_write_buffer_limit(writer)
         edge = Edge(writer=writer, reader=reader)
 
         logger_main.debug(
@@ -1212,7 +1408,10 @@ class ChaskiNode:
                 try:
                     length_data_bin = await edge.reader.readexactly(4)
                     length_topic_bin = await edge.reader.readexactly(4)
-                except:
+                except Exception:
+                    # A stopped node has nothing left to read from a closed stream
+                    if self.server_closing and edge.reader.at_eof():
+                        return
                     await asyncio.sleep(0.1)
                     continue
 
@@ -1376,6 +1575,30 @@ class ChaskiNode:
             logger_main.debug(f"{self.name}: Node is successfully paired.")
             self.paired_event[subscription].set()
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _unix_path(ip: str, port: int) -> str:
+        """
+        Return the Unix domain socket path of the node listening at an address.
+
+        The socket file is created in the temporary directory and removed when
+        the node stops. The port is held by the UDP server of the node, which
+        keeps paths unique between the nodes of a host.
+
+        Parameters
+        ----------
+        ip : str
+            The IP address of the node.
+        port : int
+            The port of the node.
+
+        Returns
+        -------
+        str
+            The path of the socket file.
+        """
+        return os.path.join(tempfile.gettempdir(), f"chaski-{ip}-{port}.sock")
+
     # ----------------------------------------------------------------------
     async def _start_tcp_server(self) -> None:
         """
@@ -1386,21 +1609,31 @@ class ChaskiNode:
         a background keep-alive task is started to manage node heartbeat and connectivity. The server will run until explicitly
         stopped or an unhandled exception occurs.
         """
-        self.server = await asyncio.start_server(
-            self._connected,
-            self.ip,
-            self.port,
-            ssl=self.ssl_context_server,
-            # reuse_address=True,
-            # reuse_port=True,
-            reuse_address=False,
-            reuse_port=False,
-        )
+        if self.transport == 'inproc':
+            self.server = await start_inproc_server(self._connected, self.ip, self.port)
+        elif self.transport == 'unix':
+            self.server = await asyncio.start_unix_server(
+                self._connected,
+                self._unix_path(self.ip, self.port),
+                ssl=self.ssl_context_server,
+            )
+        else:
+            self.server = await asyncio.start_server(
+                self._connected,
+                self.ip,
+                self.port,
+                ssl=self.ssl_context_server,
+                # Rebind ports still in TIME_WAIT after a restart, live listeners are never shared
+                reuse_address=True,
+                reuse_port=False,
+            )
 
         # Logging the server address and starting keep-alive task
-        addr = self.server.sockets[0].getsockname()
-        logger_main.debug(f"{self.name}: Serving at address {addr}.")
+        logger_main.debug(
+            f"{self.name}: Serving at address {(self.ip, self.port)} over {self.transport}."
+        )
         self._keep_alive_task = asyncio.create_task(self._keep_alive())
+        self._update_serving()
 
         # Start serving TCP connections forever
         async with self.server:
@@ -1442,6 +1675,44 @@ class ChaskiNode:
         # Call the _write_data method to send the serialized message data to the specified edge(s).
         await self._write_data(data, edges=[edge])
 
+    # ----------------------------------------------------------------------
+    async def _write_batch(
+        self,
+        command: str,
+        data_list: List[Any],
+        topic: str = 'All',
+    ) -> None:
+        """
+        Write several messages with the same command to all connected peers at once.
+
+        Each payload is packaged and framed as in `_write`, and the frames are
+        concatenated so every edge receives the whole batch in a single write
+        and drain, preserving their order.
+
+        Parameters
+        ----------
+        command : str
+            The name of the command or type of the messages to be sent.
+        data_list : List[Any]
+            The payloads of the messages, one message per item.
+        topic : str, optional
+            The topic of the messages. Defaults to 'All'.
+        """
+        data = b''.join(
+            self.serialize_message(
+                Message(
+                    command=command,
+                    topic=topic,
+                    data=data,
+                    timestamp=datetime.now(),
+                    ttl=self.ttl,
+                    uuid=self.uuid(),
+                )
+            )
+            for data in data_list
+        )
+        await self._write_data(data)
+
     # ----------------------------------------------------------------------
     def serialize_message(self, message: Message) -> bytes:
         """
@@ -1539,6 +1810,8 @@ class ChaskiNode:
         self,
         server_edge: Optional[Edge] = None,
         size: int = 0,
+        response_delay: float = 0,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Send ping messages to one or all connected edges.
@@ -1556,16 +1829,31 @@ class ChaskiNode:
         size : int, optional
             The size of the dummy data to be sent with the ping message in bytes. This
             allows simulating payload sizes and their effect on latency. Defaults to 0.
+        response_delay : float, optional
+            Seconds the remote node waits before answering with the pong message. This
+            simulates a slower link without sending a large payload. Defaults to 0.
+        timeout : Optional[float], optional
+            If set, wait up to this many seconds for the pong messages to update the
+            latency of the pinged edges. Defaults to None, which returns right after
+            sending the pings.
         """
         for id_ in self.ping_events.copy():
             edge = self.ping_events.pop(id_)
             await self.close_connection(edge)
 
-        if server_edge is None:
-            for edge in self.edges:
-                await self._ping(edge, size=size)
-        else:
-            await self._ping(server_edge, size=size)
+        edges = self.edges.copy() if server_edge is None else [server_edge]
+        for edge in edges:
+            edge.latency_updated.clear()
+            await self._ping(edge, size=size, response_delay=response_delay)
+
+        if timeout is not None:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*[edge.latency_updated.wait() for edge in edges]),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                logger_main.warning(f"{self.name}: Timeout waiting for pong messages.")
 
     # ----------------------------------------------------------------------
     async def _ping(
@@ -1574,6 +1862,7 @@ class ChaskiNode:
         delay: float = 0,
         latency_update: bool = True,
         size: int = 0,
+        response_delay: float = 0,
     ) -> None:
         """
         Send a ping message to measure latency and connectivity.
@@ -1590,6 +1879,8 @@ class ChaskiNode:
             If True, the latency information for the edge will be updated based on the ping response. Defaults to True.
         size : int, optional
             The size of the dummy payload data in bytes to be included in the ping message. Defaults to 0 bytes, meaning no additional data is sent.
+        response_delay : float, optional
+            Seconds the remote node waits before sending the pong message back. Defaults to 0 seconds.
         """
         await asyncio.sleep(delay)
         id_ = self.uuid()
@@ -1600,8 +1891,9 @@ class ChaskiNode:
             data={
                 "ping_id": id_,
                 'latency_update': latency_update,
-                'dummy_data': os.urandom(size),
+                'dummy_data': _ping_payload(size),
                 'size': size,
+                'response_delay': response_delay,
             },
             edge=server_edge,
         )
@@ -1637,6 +1929,10 @@ class ChaskiNode:
             "dummy_data": message.data["dummy_data"],
         }
 
+        # Simulate a slower link if the ping asks for it
+        if response_delay := message.data.get("response_delay"):
+            await asyncio.sleep(response_delay)
+
         await self._write(command="pong", data=data, edge=edge)
 
     # ----------------------------------------------------------------------
@@ -1667,6 +1963,7 @@ class ChaskiNode:
                 (datetime.now() - message.data["source_timestamp"]).total_seconds()
                 * 500
             )
+            server_edge.latency_updated.set()
 
         # Update the edge information with the details from the pong message
         server_edge.name = message.data["name"]
@@ -1757,7 +2054,7 @@ class ChaskiNode:
         This coroutine is invoked upon receiving a handshake response from a peer node
         in the network. It updates the edge information with the name, ip, port, and
         subscriptions of the responding node and adds the edge to the server's active
-        connections list.
+        connections list. The `connected_event` is set once the edge is registered.
 
         Parameters
         ----------
@@ -1779,6 +2076,7 @@ class ChaskiNode:
         # Adding the server edge to the list of edges
         async with self.lock:
             self.edges.append(server_edge)
+        self.connected_event.set()
 
         # Ensure the coroutine yields control back to the event loop
         await asyncio.sleep(0)
@@ -1811,6 +2109,17 @@ class ChaskiNode:
         if not self.paired:
             return
 
+        # A visited branch whose subscriptions can not match is dropped before probing
+        # the origin, the status request would not change the outcome
+        if (
+            subscription not in self.subscriptions
+            and self.name in message.data['visited']
+        ):
+            logger_main.debug(
+                f"{self.name}: This branch has already been visited: {message.data['visited']}."
+            )
+            return
+
         # Check the status of the origin node
         status = await self._request_status(
             message.data["origin_ip"],
@@ -1829,7 +2138,8 @@ class ChaskiNode:
             logger_main.debug(f"{self.name}: Discovery time-to-live (TTL) reached 0.")
             return
 
-        # Check if the node can accommodate more edges and the subscription matches
+        # Check if the node can accommodate more edges and the subscription matches,
+        # after the status request since other handlers may add edges meanwhile
         if (len(self.edges) < self.max_connections) and (
             subscription in self.subscriptions
         ):
@@ -1883,6 +2193,7 @@ class ChaskiNode:
         n = len(self.edges)
         async with self.lock:
             self.edges = [edge for edge in self.edges if not edge.writer.is_closing()]
+        self.disconnected_event.set()
         logger_main.debug(
             f"{self.name}: Removed a closing connection, {n - len(self.edges)} total edges disconnected."
         )
@@ -1926,6 +2237,22 @@ class ChaskiNode:
         self.udp_transport = transport
         self.request_response_multiplexer = {}
         self.request_response_multiplexer_events = {}
+        self._update_serving()
+
+    # ----------------------------------------------------------------------
+    def _update_serving(self) -> None:
+        """
+        Set the `serving_event` once both the TCP and the UDP servers are bound.
+
+        Called by each server as soon as it is ready, the event is only set when
+        the other one is ready too.
+        """
+        tcp_ready = self.server is not None and self.server.is_serving()
+        udp_ready = (
+            hasattr(self, 'udp_transport') and not self.udp_transport.is_closing()
+        )
+        if tcp_ready and udp_ready:
+            self.serving_event.set()
 
     # ----------------------------------------------------------------------
     async def _send_udp_message(
@@ -2145,7 +2472,9 @@ class ChaskiNode:
             `True` if the current node is connected to the specified node; otherwise, `False`.
 
         """
-        return (node.ip, node.port) in [(edge.ip, edge.port) for edge in self.edges]
+        return any(
+            (edge.ip, edge.port) == (node.ip, node.port) for edge in self.edges
+        )
 
     # ----------------------------------------------------------------------
     def _get_status(self, **kwargs) -> dict:
@@ -2225,8 +2554,8 @@ class ChaskiNode:
             The edge to which the reconnection attempts will be made. This represents the lost connection that needs
             to be restored.
         """
-        # If the reconnection attempt limit is set to zero, skip reconnection
-        if not self.reconnections:
+        # If the reconnection attempt limit is set to zero or the node is stopping, skip reconnection
+        if not self.reconnections or self.server_closing:
             self.reconnecting.clear()
             return
 
@@ -2538,11 +2867,19 @@ class ChaskiNode:
 
         Raises
         ------
+        ConnectionError
+            If the CA can not be reached, or does not sign the request, within
+            `request_ssl_certificate_timeout` seconds.
         Exception
             If there is an error during the SSL certificate request or signing process.
 
         Notes
         -----
+        If `ssl_certificate_cache_ttl` is set and certificates signed within that time
+        for the same node name and IP, by the CA at `ca_address`, are found, they are
+        loaded and steps 1 to 5 and 7 are skipped. Certificates not issued by the stored
+        CA certificate are never reused.
+
         The method performs the following steps:
         1. Generates a CSR locally.
         2. Establishes a connection with the CA node.
@@ -2567,13 +2904,25 @@ class ChaskiNode:
         elif ipv6:
             ip_address = ipaddress.IPv6Address(self.ip)
 
-        # Initialize the CertificateAuthority object to manage SSL certificates.
+        # Initialize the CertificateAuthority object to manage SSL certificates,
+        # cached certificates are stored under the node name, its IP and the CA address,
+        # so later nodes only find them when certified by the same CA for the same IP.
+        cache_id = '_'.join([self.name, self.ip, ipv4 or ipv6, port]).replace(':', '-')
         ca = CertificateAuthority(
-            self.id,
+            cache_id if self.ssl_certificate_cache_ttl else self.id,
             ip_address,
             ssl_certificates_location=self.ssl_certificates_location,
             ssl_certificate_attributes=self.ssl_certificate_attributes,
         )
+
+        # Reuse recently signed certificates and skip the request to the CA.
+        if self.ssl_certificate_cache_ttl and ca.load_signed_certificates(
+            self.ssl_certificate_cache_ttl
+        ):
+            logger_main.debug(f"{self.name}: Using cached SSL certificates.")
+            await self._restart_with_ssl_context(ca)
+            return
+
         # Generate the keys and the Certificate Signing Request (CSR).
         ca.generate_key_and_csr()
 
@@ -2583,9 +2932,14 @@ class ChaskiNode:
 
         # Establish a connection with the Certificate Authority (CA) node to request SSL certification.
         try:
-            ca_edge = await self.connect(ca_address)
-        except:
-            raise Exception("The Certification Authority is not operational.")
+            ca_edge = await asyncio.wait_for(
+                self.connect(ca_address),
+                timeout=self.request_ssl_certificate_timeout,
+            )
+        except Exception as error:
+            raise ConnectionError(
+                "The Certification Authority is not operational."
+            ) from error
 
         # Prepare the data for the Certificate Signing Request (CSR) including
         # the CSR data and the node's unique identifier (node_id). Then,
@@ -2595,11 +2949,20 @@ class ChaskiNode:
             'csr_data_server': csr_data_server,
             'node_id': self.id,
         }
-        data_response = await self._generic_request_udp(
-            callback='sign_csr',
-            kwargs=data,
-            edge=ca_edge,
-        )
+        try:
+            data_response = await asyncio.wait_for(
+                self._generic_request_udp(
+                    callback='sign_csr',
+                    kwargs=data,
+                    edge=ca_edge,
+                ),
+                timeout=self.request_ssl_certificate_timeout,
+            )
+        except asyncio.TimeoutError as error:
+            await self.close_connection(ca_edge)
+            raise ConnectionError(
+                "The Certification Authority did not sign the request."
+            ) from error
 
         signed_csr_client = data_response['signed_csr_client']
         signed_csr_server = data_response['signed_csr_server']
@@ -2614,15 +2977,62 @@ class ChaskiNode:
         logger_main.debug(
             f"{self.name}: SSL certificate request process completed successfully."
         )
-        # Load a new SSL context with the generated root CA's certificate and signed certificate.
-        self.ssl_context_client, self.ssl_context_server = ca.get_context()
 
         # Close the connection with the Certificate Authority (CA) node after obtaining the signed certificate.
         await self.close_connection(ca_edge)
 
+        await self._restart_with_ssl_context(ca)
+
+    # ----------------------------------------------------------------------
+    async def _restart_with_ssl_context(self, ca: 'CertificateAuthority') -> None:
+        """
+        Load the SSL contexts from the signed certificates and restart the node.
+
+        Parameters
+        ----------
+        ca : CertificateAuthority
+            The CertificateAuthority object holding the paths to the signed certificates,
+            the private keys and the CA's certificate.
+
+        Raises
+        ------
+        Exception
+            If the SSL contexts could not be created.
+        ConnectionError
+            If the servers are not serving again within `request_ssl_certificate_timeout`
+            seconds.
+        """
+        # Load a new SSL context with the generated root CA's certificate and signed certificate.
+        self.ssl_context_client, self.ssl_context_server = ca.get_context()
+        if not (self.ssl_context_client and self.ssl_context_server):
+            raise Exception("Failed to create SSL contexts")
+
+        # Cached certificates are loaded right away, a start of the servers that is
+        # still binding must finish first, so it is stopped instead of left behind.
+        if not self.server_closing:
+            await self._wait_serving()
+
         # Restart the node by stopping the current event loop and then creating a new event loop task to run the node.
         await self.stop()
         asyncio.create_task(self.run())
+        await self._wait_serving()
 
-        if not (self.ssl_context_client and self.ssl_context_server):
-            raise Exception("Failed to create SSL contexts")
+    # ----------------------------------------------------------------------
+    async def _wait_serving(self) -> None:
+        """
+        Wait for the servers of the node to be bound while restarting it.
+
+        Raises
+        ------
+        ConnectionError
+            If the servers are not serving within `request_ssl_certificate_timeout` seconds.
+        """
+        try:
+            await asyncio.wait_for(
+                self.serving_event.wait(),
+                timeout=self.request_ssl_certificate_timeout,
+            )
+        except asyncio.TimeoutError as error:
+            raise ConnectionError(
+                f"{self.name}: The node did not restart with the new SSL context."
+            ) from error
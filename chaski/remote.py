@@ -17,17 +17,23 @@ Classes
     - *ChaskiRemote*: Extends `ChaskiNode` to create and manage proxies, enabling remote interactions and method invocations.
 """
 
+import time
 import asyncio
 import logging
 import importlib
 import nest_asyncio
 from copy import copy
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Hashable, List, Optional, Tuple
 
 from chaski.node import ChaskiNode
 from chaski.utils.debug import styled_logger
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Initialize logger for ChaskiRemote operations
 logger_remote = styled_logger(logging.getLogger("ChaskiRemote"))
 
@@ -838,16 +844,7 @@ class ChaskiProxy:
         for obj in self._chain[1:]:
             self._cleanup_dynamic_attribute(obj)
 
-        # Process the status and response from the proxied method call.
-        # Depending on the status, return the deserialized object, raise an exception,
-        # or return a textual representation of the object.
-        match status:
-            case 'serialized':
-                return self._node.deserializer(response)
-            case 'exception':
-                raise Exception(response)
-            case 'repr':
-                return response
+        return self._node._process_proxy_response(status, response)
 
 
 ########################################################################
@@ -865,6 +862,9 @@ class ChaskiRemote(ChaskiNode):
         self,
         available: Optional[str] = None,
         *args: tuple[Any, ...],
+        cacheable: Optional[List[str]] = None,
+        cache_ttl: float = 0.1,
+        cache_maxsize: int = 1024,
         **kwargs: dict[str, Any],
     ):
         """
@@ -876,18 +876,44 @@ class ChaskiRemote(ChaskiNode):
 
         Parameters
         ----------
-        available : str, optional
-            A string indicating available services for the remote node.
+        available : str or list of str, optional
+            The modules available for remote access on this node. They are imported
+            and registered eagerly, so the first remote call does not pay the import
+            cost; modules that fail to import are logged and removed from the list.
+            If None, any module can be requested, an empty list allows none.
         *args : tuple of Any
             Positional arguments to be passed to the parent ChaskiNode class.
+        cacheable : list of str, optional
+            Dotted paths of read-only attributes or functions, e.g. `'os.listdir'`,
+            whose results can be reused for repeated calls with the same arguments.
+            Nothing is cached by default.
+        cache_ttl : float, optional
+            Seconds a cached result stays valid. Defaults to 0.1.
+        cache_maxsize : int, optional
+            Maximum number of cached results, the oldest are dropped first. Defaults to 1024.
         **kwargs : dict of {str: Any}
             Keyword arguments to be passed to the parent ChaskiNode class.
         """
         super().__init__(*args, **kwargs)
         self.proxies = {}
-        self.available = available
+        if isinstance(available, str):
+            available = [available]
+        self.available = None if available is None else list(available)
         self.proxy_lock = asyncio.Lock()
 
+        # Results of cacheable calls, mapped to their expiration time
+        self.cacheable = set(cacheable or [])
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self.proxy_cache = {}
+
+        for module in list(self.available or []):
+            try:
+                self.register_module(module, importlib.import_module(module))
+            except Exception as e:
+                logger_remote.error(f"{self.name}: Unable to import {module}: {e}")
+                self.available.remove(module)
+
     # ----------------------------------------------------------------------
     def __repr__(self) -> str:
         """
@@ -951,6 +977,8 @@ class ChaskiRemote(ChaskiNode):
 
         This asynchronous method obtains a proxy associated with a given service name.
         The proxy can be used to remotely invoke methods on the registered service.
+        It is returned once a remote node has confirmed, and registered if needed,
+        the module, so it can be used right away.
 
         Parameters
         ----------
@@ -975,6 +1003,114 @@ class ChaskiRemote(ChaskiNode):
                 f"Module {module} not found in the conected edges"
             )
 
+    # ----------------------------------------------------------------------
+    def proxy_batch(
+        self,
+        calls: list[Tuple[str, Optional[tuple], Optional[dict]]],
+        edge=None,
+    ) -> list:
+        """
+        Perform several remote calls with a single request per edge.
+
+        Each call is described by the dotted path of the object, starting with the
+        module name, and the positional and keyword arguments. All the calls for the
+        same edge are packed into one request and executed in order on the remote node,
+        avoiding a round trip for each of them.
+
+        Parameters
+        ----------
+        calls : list of tuple(str, tuple or None, dict or None)
+            The calls to perform, for example `('os.listdir', ('.',), {})`. When both
+            `args` and `kwargs` are None, callables are called without arguments and any
+            other attribute is returned as is.
+        edge : Optional[str]
+            The specific edge to connect with for the modules' availability. Default is None.
+
+        Returns
+        -------
+        list
+            The results of the calls, in the same order as `calls`.
+
+        Raises
+        ------
+        Exception
+            If a module is not available or any of the remote calls raises an exception.
+        """
+        proxies = {}
+        batches = {}
+        for index, (path, args, kwargs) in enumerate(calls):
+            name, *obj = path.split('.')
+
+            # Verify each module only once, the proxy holds the edge where it is available
+            if name not in proxies:
+                proxies[name] = self.proxy(name, edge)
+                if proxies[name] is None:
+                    raise Exception(f"Module {name} not found in the conected edges")
+
+            edge_ = proxies[name]._edge
+            data = {
+                'name': name,
+                'obj': obj,
+                'args': args,
+                'kwargs': kwargs,
+                'timestamp': datetime.now(),
+            }
+            batches.setdefault(id(edge_), (edge_, []))[1].append((index, data))
+
+        results = [None] * len(calls)
+        for edge_, batch in batches.values():
+            responses = asyncio.get_event_loop().run_until_complete(
+                self._generic_request_udp(
+                    callback='_call_batch_by_proxy',
+                    kwargs={'calls': [data for _, data in batch]},
+                    edge=edge_,
+                )
+            )
+            for (index, _), (status, response) in zip(batch, responses):
+                results[index] = self._process_proxy_response(status, response)
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def _process_proxy_response(self, status: str, response: Any) -> Any:
+        """
+        Decode the response of a remote call performed through a proxy.
+
+        Parameters
+        ----------
+        status : str
+            The status returned by the remote node, one of 'serialized', 'ndarray',
+            'exception' or 'repr'.
+        response : Any
+            The payload returned by the remote node.
+
+        Returns
+        -------
+        Any
+            The deserialized object, or its textual representation.
+
+        Raises
+        ------
+        Exception
+            If the remote call raised an exception.
+        ImportError
+            If the response is an array and numpy is not installed.
+        """
+        # Depending on the status, return the deserialized object, raise an exception,
+        # or return a textual representation of the object.
+        match status:
+            case 'serialized':
+                return self.deserializer(response)
+            case 'ndarray':
+                if np is None:
+                    raise ImportError("numpy is required to receive remote arrays")
+                dtype, shape, buffer = response
+                return np.frombuffer(bytearray(buffer), dtype=dtype).reshape(shape)
+            case 'exception':
+                raise Exception(response)
+            case 'repr':
+                return response
+
     #     # ----------------------------------------------------------------------
     #     def geeeet(self, obj, obj_chain):
     #         """"""
@@ -1031,6 +1167,12 @@ class ChaskiRemote(ChaskiNode):
 
         if name in self.proxies:
 
+            cache_key = self._cache_key(name, obj, args, kwargs_)
+            if cache_key is not None:
+                expiration, result = self.proxy_cache.get(cache_key, (0, None))
+                if expiration > time.monotonic():
+                    return result
+
             if (args is None) and (kwargs_ is None):
                 try:
                     attr = self.proxies[name]._object(obj)()
@@ -1055,18 +1197,108 @@ class ChaskiRemote(ChaskiNode):
             self.proxies[name]._reset()
 
             if callable(attr):
-                return 'repr', repr(attr)
+                result = 'repr', repr(attr)
+            elif (
+                np is not None
+                and type(attr) is np.ndarray
+                and attr.dtype.names is None
+                and not attr.dtype.hasobject
+            ):
+                # Plain arrays travel as raw buffers, avoiding the pickle machinery.
+                # Subclasses, such as masked arrays, and structured dtypes are serialized,
+                # the dtype string would lose the mask or the field names.
+                result = 'ndarray', (attr.dtype.str, attr.shape, attr.tobytes())
             else:
                 try:
-                    return 'serialized', self.serializer(attr)
+                    result = 'serialized', self.serializer(attr)
                 except:
-                    return 'serialized', repr(attr)
+                    result = 'serialized', repr(attr)
+
+            if cache_key is not None:
+                self._cache_result(cache_key, result)
+            return result
         else:
             return (
                 'exception',
                 'No proxy available for the requested service',
             )
 
+    # ----------------------------------------------------------------------
+    def _cache_key(
+        self,
+        name: str,
+        obj: list[str],
+        args: Any,
+        kwargs: Any,
+    ) -> Optional[Hashable]:
+        """
+        Build the cache key for a proxied call, if its result can be cached.
+
+        Parameters
+        ----------
+        name : str
+            The name of the proxied module.
+        obj : list of str
+            The chain of attributes accessed on the module.
+        args : Any
+            The positional arguments of the call.
+        kwargs : Any
+            The keyword arguments of the call.
+
+        Returns
+        -------
+        Hashable or None
+            The key for the call, or None if the attribute is not marked as
+            cacheable or the arguments are not hashable.
+        """
+        if '.'.join([name, *obj]) not in self.cacheable:
+            return None
+
+        if isinstance(kwargs, dict):
+            kwargs = tuple(sorted(kwargs.items()))
+        key = (name, tuple(obj), args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    # ----------------------------------------------------------------------
+    def _cache_result(self, key: Hashable, result: Tuple[str, Any]) -> None:
+        """
+        Store the result of a cacheable call for `cache_ttl` seconds.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key built by `_cache_key`.
+        result : tuple of (str, Any)
+            The `(status, response)` tuple returned to the caller.
+        """
+        # Only expired keys are stored again, reinserting them keeps the dict ordered
+        # by storage time, so the first entries are always the oldest to evict
+        self.proxy_cache.pop(key, None)
+        while len(self.proxy_cache) >= self.cache_maxsize:
+            self.proxy_cache.pop(next(iter(self.proxy_cache)))
+        self.proxy_cache[key] = (time.monotonic() + self.cache_ttl, result)
+
+    # ----------------------------------------------------------------------
+    async def _call_batch_by_proxy(self, calls: list[dict[str, Any]]) -> list:
+        """
+        Call several methods on proxied objects, in order.
+
+        Parameters
+        ----------
+        calls : list of dict
+            The calls to perform, each one with the same keys expected by `_call_obj_by_proxy`.
+
+        Returns
+        -------
+        list
+            The `(status, response)` tuples for each call.
+        """
+        return [await self._call_obj_by_proxy(**data) for data in calls]
+
     # ----------------------------------------------------------------------
     async def _verify_availability(self, module: str, edge=None) -> Any:
         """
@@ -1143,9 +1375,13 @@ class ChaskiRemote(ChaskiNode):
         module = kwargs['module']
 
         # Check if the module is listed as available on this node
-        if (self.available) and (not module in self.available):
+        if (self.available is not None) and (not module in self.available):
             return False
 
+        # Modules listed in `available` are already registered at initialization
+        if module in self.proxies:
+            return True
+
         try:
             # Dynamically import the specified module
             imported_module = importlib.import_module(module)
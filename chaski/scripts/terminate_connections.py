@@ -4,30 +4,43 @@ import sys
 
 
 # ----------------------------------------------------------------------
-def close_connections(port):
-    """"""
-    print(f"Cleaning connections on port {port}...")
+def close_connections(start_port, end_port=None):
+    """
+    Kill the processes with connections on a port or a range of ports.
+
+    A single `lsof` call lists the processes for the whole range, instead of
+    spawning one per port. Its error output is passed through to the terminal.
+
+    Parameters
+    ----------
+    start_port : int
+        The first port of the range, or the only port if `end_port` is None.
+    end_port : int, optional
+        The last port of the range, inclusive.
+    """
+    ports = str(start_port) if end_port is None else f"{start_port}-{end_port}"
+    print(f"Cleaning connections on port {ports}...")
 
     try:
-        # Run the lsof command to get the PIDs of active connections on the specified port
+        # Run the lsof command to get the PIDs of active connections on the specified ports
         result = subprocess.run(
-            ["lsof", "-i", f":{port}", "-t"],
+            ["lsof", "-i", f":{ports}", "-t"],
             stdout=subprocess.PIPE,
             text=True,
         )
-        pids = result.stdout.strip().splitlines()
+        pids = set(result.stdout.split()) - {str(os.getpid())}
 
         if not pids:
-            print(f"No active connections on port {port}.")
+            print(f"No active connections on port {ports}.")
         else:
             # Close all active connections
-            for pid in pids:
+            for pid in sorted(pids, key=int):
                 print(f"Closing connection with PID {pid}...")
                 os.kill(int(pid), 9)
 
     except Exception as e:
         print(
-            f"An error occurred while trying to close connections on port {port}: {e}"
+            f"An error occurred while trying to close connections on port {ports}: {e}"
         )
 
 
@@ -46,6 +59,5 @@ def main():
         print(f"Error in port range: {e}")
         sys.exit(1)
 
-    # Iterate over the range of ports and close active connections
-    for port in range(START_PORT, END_PORT + 1):
-        close_connections(port)
+    # Close the active connections of the whole range at once
+    close_connections(START_PORT, END_PORT)
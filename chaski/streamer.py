@@ -14,16 +14,61 @@ Classes
     - *ChaskiStreamer*: Extends ChaskiNode to provide asynchronous message streaming capabilities.
 """
 
+import io
 import os
 import asyncio
 import hashlib
+import inspect
+import logging
+import mmap
 from queue import Queue as SyncQueue
 from asyncio import Queue
-from typing import Generator
-from chaski.node import ChaskiNode
+from typing import AsyncGenerator, Generator, List, Optional
+from chaski.node import ChaskiNode, Edge
 from chaski.utils.persistent_storage import PersistentStorage
+from chaski.utils.debug import styled_logger
 from typing import Any
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Initialize logger for ChaskiStreamer operations
+logger_streamer = styled_logger(logging.getLogger("ChaskiStreamer"))
+
+# Digest used for file transfers, BLAKE3 is opt-in since every receiver must support it
+DEFAULT_HASH_ALGORITHM = 'sha256'
+
+
+# ----------------------------------------------------------------------
+def new_hash(algorithm: str, threaded: bool = False) -> Any:
+    """
+    Create a hash object for the given algorithm name.
+
+    Parameters
+    ----------
+    algorithm : str
+        Any name accepted by `hashlib.new`, or 'blake3' when the optional
+        `blake3` package is installed.
+    threaded : bool, optional
+        Let BLAKE3 hash large buffers with multiple threads. Only worth it
+        for large `update` calls, such as a memory-mapped file. Ignored by
+        the `hashlib` algorithms.
+
+    Returns
+    -------
+    Any
+        A hash object exposing `update` and `hexdigest`.
+    """
+    if algorithm == 'blake3':
+        if blake3 is None:
+            raise ValueError("The 'blake3' hash algorithm requires the blake3 package")
+        if threaded:
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return blake3.blake3()
+    return hashlib.new(algorithm)
+
 
 ########################################################################
 class ChaskiStreamer(ChaskiNode):
@@ -45,6 +90,8 @@ class ChaskiStreamer(ChaskiNode):
         allow_incoming_files: bool = False,
         sync: bool = False,
         persistent_storage: bool = False,
+        read_ahead: int = 64,
+        hash_algorithm: str = DEFAULT_HASH_ALGORITHM,
         *args: tuple,
         **kwargs: dict,
     ):
@@ -65,6 +112,11 @@ class ChaskiStreamer(ChaskiNode):
             Flag to enable or disable synchronous processing. Defaults to False.
         persistent_storage : bool, optional
             Flag to enable or disable persistent storage. Defaults to False.
+        read_ahead : int, optional
+            Number of chunks read from a file in a single executor call by `push_file`. Defaults to 64.
+        hash_algorithm : str, optional
+            Digest used to verify transferred files. Any name accepted by `hashlib.new`, or 'blake3' when the
+            optional blake3 package is installed on both ends. Defaults to 'sha256'.
         *args : tuple
             Additional positional arguments to pass to the superclass initializer.
         **kwargs : dict
@@ -80,6 +132,11 @@ class ChaskiStreamer(ChaskiNode):
             self.message_queue = Queue()
 
         self.chunk_size = chunk_size
+        self.read_ahead = read_ahead
+        self.hash_algorithm = hash_algorithm
+        # Files being received, keyed by the writer of the sending edge and the filename:
+        # running digest, buffered chunks and pending write
+        self.incoming_files = {}
         self.destination_folder = destination_folder
         self.file_handling_callback = file_handling_callback
         self.allow_incoming_files = allow_incoming_files
@@ -122,12 +179,17 @@ class ChaskiStreamer(ChaskiNode):
 
     # ----------------------------------------------------------------------
     @classmethod
-    def get_hash(cls, file: str, algorithm: str = 'sha256') -> str:
+    def get_hash(
+        cls, file: str, algorithm: str = 'sha256', chunk_size: int = 1 << 20
+    ) -> str:
         """
         Compute the hash of a file using the specified algorithm.
 
-        This method reads the file in chunks and computes the hash digest
-        using the provided hashing algorithm. The default algorithm is SHA-256.
+        Regular files are memory-mapped and hashed with a single `update` call,
+        or in 64 MiB slices when larger than 256 MiB to cap resident memory,
+        BLAKE3 hashes the mapping with multiple threads.
+        Files that cannot be mapped (empty or special files) are read in
+        `chunk_size` blocks. The default algorithm is SHA-256.
 
         Parameters
         ----------
@@ -135,17 +197,35 @@ class ChaskiStreamer(ChaskiNode):
             The path to the file for which to compute the hash.
         algorithm : str, optional
             The hashing algorithm to use. Defaults to 'sha256'.
-            Other common algorithms include 'md5', 'sha1', 'sha512', etc.
+            Other common algorithms include 'md5', 'sha1', 'sha512', 'blake2b', etc.,
+            and 'blake3' when the blake3 package is installed.
+        chunk_size : int, optional
+            The number of bytes read per block when the file is not
+            memory-mapped. Defaults to 1 MiB.
 
         Returns
         -------
         str
             The hexadecimal hash digest of the file.
         """
-        hash_func = hashlib.new(algorithm)
         with open(file, 'rb') as f:
-            while chunk := f.read(8192):  # Read the file in 8192 byte blocks
-                hash_func.update(chunk)
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None
+
+            if mapped is None:
+                hash_func = new_hash(algorithm)
+                while chunk := f.read(chunk_size):
+                    hash_func.update(chunk)
+            else:
+                # Large contiguous updates let BLAKE3 spread the work over threads
+                hash_func = new_hash(algorithm, threaded=True)
+                with mapped, memoryview(mapped) as view:
+                    step = len(view) if len(view) <= 256 << 20 else 64 << 20
+                    for offset in range(0, len(view), step):
+                        with view[offset : offset + step] as block:
+                            hash_func.update(block)
         return hash_func.hexdigest()
 
     # ----------------------------------------------------------------------
@@ -252,6 +332,24 @@ class ChaskiStreamer(ChaskiNode):
         """
         await self._write('ChaskiMessage', data=data, topic=topic)
 
+    # ----------------------------------------------------------------------
+    async def push_batch(self, topic: str, data_list: List[Any]) -> None:
+        """
+        Write several messages to the specified topic in a single write per edge.
+
+        Equivalent to calling `push` for each item in order, but the framed
+        messages are sent together, so the receivers get them back to back
+        without waiting for a drain between messages.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to which the messages are to be sent.
+        data_list : List[Any]
+            The payloads to send, one `ChaskiMessage` per item.
+        """
+        await self._write_batch('ChaskiMessage', data_list, topic=topic)
+
     # ----------------------------------------------------------------------
     async def _process_ChaskiMessage(self, message: 'Message', edge: 'Edge') -> None:
         """
@@ -361,6 +459,7 @@ class ChaskiStreamer(ChaskiNode):
         file: 'IOBase',
         filename: str = None,
         data: dict = {},
+        precomputed_hash: Optional[str] = None,
     ):
         """
         Asynchronously sends a file chunk by chunk to the specified topic.
@@ -380,28 +479,35 @@ class ChaskiStreamer(ChaskiNode):
             and sent in chunks.
         filename : str, optional
             The name of the file being sent. If not provided, the name attribute of the file object is used.
+        data : dict, optional
+            Additional data sent along with every chunk.
+        precomputed_hash : Optional[str], optional
+            The digest of the whole file computed with `hash_algorithm`, for files whose hash is
+            already known. When given, the file is not hashed while it is sent.
 
         Notes
         -----
         This method uses asynchronous I/O to read the file in chunks and send each chunk
         without blocking the event loop. It ensures that the entire file is processed and sent
-        even if the process involves multiple chunks.
+        even if the process involves multiple chunks. Blocking file objects are read in
+        blocks of `read_ahead` chunks on the default executor, and file objects with a
+        coroutine `read` method (e.g. `aiofiles`) are awaited directly. Blocks are hashed
+        as they are read, so the `hash` sent with the final, empty chunk is the digest of
+        the whole file.
         """
         size = 0
-        # Initialize a SHA-256 hash function for computing the hash digest of the file chunks
-        hash_func = hashlib.new('sha256')
-        while True:
-            # Read the next chunk of data from the file up to the specified chunk size
-            chunk = file.read(self.chunk_size)
+        # Initialize the hash function for computing the hash digest of the file chunks, unless it is known
+        hash_func = None if precomputed_hash else new_hash(self.hash_algorithm)
+        # The hash is updated block by block as the file is read, in the same executor call
+        async for chunk in self._read_chunks(file, hash_func):
             # Increment the size by the length of the current chunk
             size += len(chunk)
-            # Update the hash function with the current chunk of data.
-            hash_func.update(chunk)
             # Package the chunked file data along with metadata such as filename, hash, and chunk size
             package_data = {
                 'filename': (filename if filename else os.path.split(file.name)[-1]),
                 'chunk': chunk,
-                'hash': hash_func.hexdigest(),
+                'hash': precomputed_hash or hash_func.hexdigest(),
+                'hash_algorithm': self.hash_algorithm,
                 'data': data,
                 'chunk_size': self.chunk_size,
                 'size': size,
@@ -411,9 +517,76 @@ class ChaskiStreamer(ChaskiNode):
             await self._write('ChaskiFile', data=package_data, topic=topic)
             await asyncio.sleep(0)  # very important sleep
 
-            # If no more chunks are available to read, the file transfer is complete
-            if not chunk:
-                break
+    # ----------------------------------------------------------------------
+    async def _read_chunks(
+        self, file: 'IOBase', hash_func: Optional[Any] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Read a file in `chunk_size` pieces without blocking the event loop.
+
+        Blocking reads are batched into blocks of `read_ahead` chunks and run on
+        the default executor, so the cost of the thread hop is paid once per block
+        instead of once per chunk. `io.BytesIO` buffers are read directly. The
+        generator ends with an empty chunk, which marks the end of the transfer
+        for the receiver.
+
+        Parameters
+        ----------
+        file : IOBase
+            A file-like object with a blocking or coroutine `read` method.
+        hash_func : Optional[Any], optional
+            A hash object updated with every block read, in the executor for
+            blocking files, so the event loop never hashes the data.
+
+        Yields
+        ------
+        bytes
+            The next chunk of the file, followed by a final empty chunk.
+        """
+        loop = asyncio.get_running_loop()
+        block_size = self.chunk_size * self.read_ahead
+        while True:
+            if inspect.iscoroutinefunction(file.read):
+                block = await file.read(block_size)
+                if hash_func is not None:
+                    hash_func.update(block)
+            elif isinstance(file, io.BytesIO):
+                # In-memory buffers never block, the thread hop would cost more than the read
+                block = self._read_block(file, block_size, hash_func)
+            else:
+                block = await loop.run_in_executor(
+                    None, self._read_block, file, block_size, hash_func
+                )
+            if not block:
+                yield b''
+                return
+            for offset in range(0, len(block), self.chunk_size):
+                yield block[offset : offset + self.chunk_size]
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _read_block(file: 'IOBase', size: int, hash_func: Optional[Any]) -> bytes:
+        """
+        Read a block from a blocking file object and add it to a running hash.
+
+        Parameters
+        ----------
+        file : IOBase
+            A file-like object with a blocking `read` method.
+        size : int
+            The maximum number of bytes to read.
+        hash_func : Optional[Any]
+            A hash object updated with the block, or None.
+
+        Returns
+        -------
+        bytes
+            The block read, empty at the end of the file.
+        """
+        block = file.read(size)
+        if hash_func is not None:
+            hash_func.update(block)
+        return block
 
     # ----------------------------------------------------------------------
     async def _process_ChaskiFile(self, message: 'Message', edge: 'Edge') -> None:
@@ -435,34 +608,253 @@ class ChaskiStreamer(ChaskiNode):
 
         Notes
         -----
-        This method performs asynchronous file I/O using the `open` function with the 'ab' mode to append each chunk of
-        data. It checks if the chunk data is empty, indicating that all chunks have been received, and then invokes the
-        file_input_callback function, if provided.
+        This method checks if the chunk data is empty, indicating that all chunks have been received, and then invokes
+        the file_input_callback function, if provided. The digest of the received bytes is computed as chunks arrive and
+        passed to the callback as `computed_hash`, together with `verified`, True when it matches the sender's `hash`.
+        If the sender's `hash_algorithm` is not available on this node, the file is still received, `computed_hash` is
+        None and `verified` is False.
+        Chunks are digested and written in blocks on the default executor, so the event loop keeps reading the
+        connection while a block is processed, and verification needs no extra pass over the file. The target file is
+        opened once per transfer, replacing any previous file with the same name.
+        Transfers are tracked per edge, if the edge is closed before the last chunk arrives
+        the partial file is discarded, see `_discard_incoming_files`.
         """
         # Check if the processing of incoming file chunks is allowed.
         if not self.allow_incoming_files:
             return
 
-        # Append incoming file chunk data to the target file in append-binary mode
+        filename = message.data['filename']
+        # Edges are not hashable, their writer identifies them as in `Edge.__eq__`
+        key = (edge.writer, filename)
+        if key not in self.incoming_files:
+            algorithm = message.data.get('hash_algorithm', 'sha256')
+            try:
+                hash_func = new_hash(algorithm)
+            except ValueError:
+                # Raising here would close the edge from the reader loop
+                logger_streamer.warning(
+                    f"{self.name}: Unsupported hash algorithm '{algorithm}', {filename} can not be verified."
+                )
+                hash_func = None
+            self.incoming_files[key] = {
+                'hash': hash_func,
+                'chunks': [],
+                'buffered': 0,
+                'pending': None,
+                'file': None,
+            }
+        incoming = self.incoming_files[key]
+
+        # Buffer incoming chunks, blocks of `read_ahead` chunks are digested and written in a worker thread
         if chunk := message.data.pop('chunk'):
-            with open(
-                os.path.join(self.destination_folder, message.data['filename']),
-                'ab',
-            ) as file:
-                # Write the current chunk to the target file in append-binary mode
-                file.write(chunk)
+            incoming['chunks'].append(chunk)
+            incoming['buffered'] += len(chunk)
+            if incoming['buffered'] >= self.chunk_size * self.read_ahead:
+                await self._flush_incoming_file(filename, incoming)
 
         else:
+            # The transfer is complete, closing the edge meanwhile must not discard it
+            del self.incoming_files[key]
+            await self._flush_incoming_file(filename, incoming)
+            if incoming['pending'] is not None:
+                await incoming['pending']
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._close_incoming_file,
+                os.path.join(self.destination_folder, filename),
+                incoming,
+            )
+            computed_hash = incoming['hash'] and incoming['hash'].hexdigest()
             # Invoke the file input callback if it is callable, passing message data and destiny folder
             if callable(self.file_handling_callback):
                 # If a file input callback is defined, call it with message data and destiny folder
                 self.file_handling_callback(
                     **{
                         **message.data,
+                        'computed_hash': computed_hash,
+                        'verified': computed_hash is not None
+                        and computed_hash == message.data['hash'],
                         'destiny_folder': self.destination_folder,
                     }
                 )
 
+    # ----------------------------------------------------------------------
+    async def _flush_incoming_file(self, filename: str, incoming: dict) -> None:
+        """
+        Hand the buffered chunks of an incoming file to a worker thread.
+
+        The previous block of the file is awaited first, so blocks are written in
+        order and at most one is in flight, then the new block is scheduled without
+        waiting for it.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file being received.
+        incoming : dict
+            The state of the transfer, as stored in `incoming_files`.
+        """
+        if incoming['pending'] is not None:
+            await incoming['pending']
+            incoming['pending'] = None
+        if not incoming['chunks']:
+            return
+
+        block = b''.join(incoming['chunks'])
+        incoming['chunks'].clear()
+        incoming['buffered'] = 0
+        incoming['pending'] = asyncio.get_running_loop().run_in_executor(
+            None,
+            self._append_block,
+            os.path.join(self.destination_folder, filename),
+            incoming,
+            block,
+        )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _append_block(path: str, incoming: dict, block: bytes) -> None:
+        """
+        Digest a block of an incoming file and append it to the target file.
+
+        Runs in a worker thread. Hash objects release the GIL on large inputs, so
+        the event loop keeps running while the block is processed. The target file
+        is opened with the first block, replacing any previous file with the same
+        name, and stays open until the transfer ends.
+
+        Parameters
+        ----------
+        path : str
+            The path of the target file.
+        incoming : dict
+            The state of the transfer, as stored in `incoming_files`.
+        block : bytes
+            The data to append.
+        """
+        if incoming['hash'] is not None:
+            incoming['hash'].update(block)
+        if incoming['file'] is None:
+            incoming['file'] = open(path, 'wb')
+        incoming['file'].write(block)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _close_incoming_file(path: str, incoming: dict) -> None:
+        """
+        Close the target file of a finished transfer.
+
+        Runs in a worker thread. Empty files never receive a block, they are
+        created here.
+
+        Parameters
+        ----------
+        path : str
+            The path of the target file.
+        incoming : dict
+            The state of the transfer, as stored in `incoming_files`.
+        """
+        if incoming['file'] is None:
+            incoming['file'] = open(path, 'wb')
+        incoming['file'].close()
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _remove_incoming_file(path: str, incoming: dict) -> None:
+        """
+        Close and delete the target file of an interrupted transfer.
+
+        Runs in a worker thread. Files that never received a block were not
+        created.
+
+        Parameters
+        ----------
+        path : str
+            The path of the target file.
+        incoming : dict
+            The state of the transfer, as stored in `incoming_files`.
+        """
+        if incoming['file'] is not None:
+            incoming['file'].close()
+            os.remove(path)
+
+    # ----------------------------------------------------------------------
+    async def _discard_incoming_files(self, edge: Optional['Edge'] = None) -> None:
+        """
+        Drop the unfinished transfers received from an edge.
+
+        The pending block of each transfer is awaited, then the target file is
+        closed and deleted, since the last chunk will never arrive.
+
+        Parameters
+        ----------
+        edge : Edge, optional
+            The edge whose transfers are discarded. If None, every unfinished
+            transfer is discarded.
+        """
+        for key in list(self.incoming_files):
+            writer, filename = key
+            if edge is not None and writer is not edge.writer:
+                continue
+
+            incoming = self.incoming_files.pop(key)
+            logger_streamer.warning(
+                f"{self.name}: The transfer of {filename} was interrupted, the partial file is removed."
+            )
+            if incoming['pending'] is not None:
+                try:
+                    await incoming['pending']
+                except Exception as e:
+                    logger_streamer.debug(f"{self.name}: {e}")
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._remove_incoming_file,
+                os.path.join(self.destination_folder, filename),
+                incoming,
+            )
+
+    # ----------------------------------------------------------------------
+    async def close_connection(
+        self, edge: 'Edge', port: Optional[int] = None
+    ) -> None:
+        """
+        Close the connection with an edge and discard its unfinished transfers.
+
+        Parameters
+        ----------
+        edge : Edge
+            The edge object representing the network connection to be closed.
+        port : Optional[int]
+            An optional port number to specifically close the connection to.
+        """
+        if port:
+            edge = self.get_edge(edge, port)
+        await super().close_connection(edge)
+        if isinstance(edge, Edge):
+            await self._discard_incoming_files(edge)
+
+    # ----------------------------------------------------------------------
+    async def _remove_closing_connection(self) -> None:
+        """
+        Remove the edges whose connection is closing and discard their unfinished transfers.
+
+        A connection lost while writing removes its edge here, without `close_connection`.
+        """
+        closing = [edge for edge in self.edges if edge.writer.is_closing()]
+        await super()._remove_closing_connection()
+        for edge in closing:
+            await self._discard_incoming_files(edge)
+
+    # ----------------------------------------------------------------------
+    async def stop(self) -> None:
+        """
+        Stop the node and discard every unfinished transfer.
+
+        Edges already removed from `edges` are not closed again by `ChaskiNode.stop`,
+        so any transfer left behind by them is discarded here.
+        """
+        await super().stop()
+        await self._discard_incoming_files()
+
     # ----------------------------------------------------------------------
     async def _process_ChaskiStorageRequest(
         self, message: "Message", edge: "Edge"
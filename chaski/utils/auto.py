@@ -9,18 +9,17 @@ of distributed node communication and coordination systems.
 """
 
 from chaski.node import ChaskiNode
-from typing import List, Union
+from typing import List, Literal, Sequence, Union
 import asyncio
 from string import ascii_uppercase
 
-PORT = 65440
-
 
 # ----------------------------------------------------------------------
 async def create_nodes(
-    subscriptions: Union[int, List[str]],
+    subscriptions: Union[int, Sequence[Union[str, Sequence[str]]]],
     ip: str = '127.0.0.1',
-    port: int = PORT,
+    port: int = 0,
+    transport: Literal['tcp', 'inproc', 'unix'] = 'tcp',
 ) -> List[ChaskiNode]:
     """
     Create a list of ChaskiNode instances.
@@ -28,17 +27,25 @@ async def create_nodes(
     This function generates a list of ChaskiNode instances with the given number of nodes
     or subscriptions. If an integer is provided for subscriptions, the first `n` letters
     of the alphabet will be used as default subscription topics. Each node will run on
-    a sequentially incremented port starting from the given port number.
+    a free port assigned by the operating system, or on a sequentially incremented port
+    starting from the given port number.
 
     Parameters
     ----------
-    subscriptions : Union[int, List[str]]
-        The number of nodes to create if an integer is provided. If a list of strings is
-        provided, each string represents a subscription topic for a node.
+    subscriptions : Union[int, Sequence[Union[str, Sequence[str]]]]
+        The number of nodes to create if an integer is provided. If a sequence is provided,
+        each item represents the subscription topic, or topics, for a node. Immutable
+        sequences such as tuples can be defined once and shared across calls.
     ip : str, optional
         The IP address where the nodes will bind to, by default '127.0.0.1'.
     port : int, optional
-        The starting port number for the nodes, by default PORT.
+        The starting port number for the nodes, by default 0, every node gets its own
+        free port. Free ports never collide between parallel test runs or with
+        addresses of a previous run still in TIME_WAIT.
+    transport : Literal['tcp', 'inproc', 'unix'], optional
+        The transport of the node streams, by default 'tcp'. 'inproc' skips the
+        TCP listeners when every node runs in the same process, 'unix' uses Unix
+        domain sockets when every node runs on the same host.
 
     Returns
     -------
@@ -46,35 +53,64 @@ async def create_nodes(
         A list of ChaskiNode instances.
     """
     if isinstance(subscriptions, int):
-        subscriptions = list(ascii_uppercase)[:subscriptions]
+        subscriptions = ascii_uppercase[:subscriptions]
 
     nodes = [
         ChaskiNode(
             ip=ip,
-            port=port + i,
+            port=port + i if port else 0,
             name=f'Node{i}',
             subscriptions=sub,
             run=True,
             ttl=15,
             paired=(i == 0),
             reconnections=None,
+            transport=transport,
         )
         for i, sub in enumerate(subscriptions)
     ]
-    port += len(subscriptions) + 1
-
-    await asyncio.sleep(0.5)
+    # Wait for every node to bind its servers instead of a fixed delay
+    await asyncio.wait_for(
+        asyncio.gather(*[node.serving_event.wait() for node in nodes]), timeout=5
+    )
     return nodes
 
 
+# ----------------------------------------------------------------------
+async def stop_nodes(nodes: Sequence[ChaskiNode]) -> None:
+    """
+    Stop several ChaskiNode instances concurrently.
+
+    Every `stop` runs to completion even if another one fails, then the first
+    exception raised by any of them is raised again, so a failing stop is
+    reported without leaving the other nodes running.
+
+    Parameters
+    ----------
+    nodes : Sequence[ChaskiNode]
+        The nodes to stop.
+
+    Raises
+    ------
+    BaseException
+        The first exception raised by the `stop` of a node, in the order of `nodes`.
+    """
+    results = await asyncio.gather(
+        *(node.stop() for node in nodes), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 # ----------------------------------------------------------------------
 async def run_transmission(producer, consumer, parent=None):
     """"""
-    await asyncio.sleep(0.3)
+    await asyncio.wait_for(producer.serving_event.wait(), timeout=5)
     # await producer.connect(consumer.address)
     await consumer.connect(producer.address)
+    await producer.wait_connected(consumer)
 
-    await asyncio.sleep(0.3)
     await producer.push(
         'topic1',
         {
@@ -100,6 +136,5 @@ async def run_transmission(producer, consumer, parent=None):
                 },
             )
 
-    await asyncio.sleep(1)
-    await consumer.stop()
-    await producer.stop()
+    await asyncio.gather(producer.drain(), consumer.drain())
+    await asyncio.gather(consumer.stop(), producer.stop())
@@ -1,16 +1,82 @@
 import os
 import ssl
+import time
 import datetime
+from functools import lru_cache
 from platformdirs import user_data_dir
 
 # Importing cryptography modules for X509 certificates, private key generation,
 # and serialization, including RSA key generation and PEM encoding without encryption.
 from cryptography import x509
+from cryptography.exceptions import InvalidSignature
 from cryptography.x509.oid import NameOID
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 
 
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _read_ca_bundle(cafile: str, mtime: int) -> str:
+    """
+    Read a Certificate Authority (CA) certificate, caching its PEM content.
+
+    Every context of a node verifies peers against the same CA certificate,
+    reading it once avoids opening the file again for each context.
+
+    Parameters
+    ----------
+    cafile : str
+        Path to the Certificate Authority (CA) certificate.
+    mtime : int
+        Modification time of `cafile`, part of the cache key.
+
+    Returns
+    -------
+    str
+        The PEM encoded CA certificate.
+    """
+    with open(cafile, 'r') as file:
+        return file.read()
+
+
+# ----------------------------------------------------------------------
+def get_ssl_context(
+    purpose: ssl.Purpose, certfile: str, keyfile: str, cafile: str
+) -> ssl.SSLContext:
+    """
+    Create an SSL context for the given certificate files.
+
+    A new context is returned on every call, so each node owns its contexts and
+    may change their options without affecting others. Only the PEM content of
+    the CA certificate is cached, and read again when the file is modified.
+
+    Parameters
+    ----------
+    purpose : ssl.Purpose
+        The purpose of the context, `SERVER_AUTH` for clients and `CLIENT_AUTH` for servers.
+    certfile : str
+        Path to the signed certificate.
+    keyfile : str
+        Path to the private key.
+    cafile : str
+        Path to the Certificate Authority (CA) certificate used for verification.
+
+    Returns
+    -------
+    ssl.SSLContext
+        An SSL context that requires certificates from the peer.
+    """
+    ssl_context = ssl.create_default_context(purpose)
+    ssl_context.load_cert_chain(certfile=certfile, keyfile=keyfile)
+    ssl_context.load_verify_locations(
+        cadata=_read_ca_bundle(cafile, os.stat(cafile).st_mtime_ns)
+    )
+    ssl_context.verify_mode = ssl.CERT_REQUIRED
+    # Keep session tickets enabled, so reconnections can resume the TLS session
+    ssl_context.options &= ~ssl.OP_NO_TICKET
+    return ssl_context
+
+
 ########################################################################
 class CertificateAuthority:
     """"""
@@ -387,6 +453,66 @@ class CertificateAuthority:
             self._key_and_csr(name='server')
         )
 
+    # ----------------------------------------------------------------------
+    def load_signed_certificates(self, max_age: float) -> bool:
+        """
+        Reuse the keys and signed certificates previously stored for this ID.
+
+        The private keys, signed certificates and the Certificate Authority (CA)
+        certificate are looked up in the SSL certificates location. They are loaded
+        only if all of them exist, were written less than `max_age` seconds ago and
+        the signed certificates were issued by the stored CA certificate, so a CSR
+        does not need to be signed again for a recently certified ID.
+
+        The CA certificate is shared by every ID in the location and is overwritten
+        when a node is certified by another CA, certificates signed by the previous
+        CA are not reused.
+
+        Parameters
+        ----------
+        max_age : float
+            Maximum age in seconds of the stored files to be considered valid.
+
+        Returns
+        -------
+        bool
+            True if the stored certificates were loaded, False otherwise.
+        """
+        paths = {}
+        for name in ('client', 'server'):
+            paths[name] = (
+                os.path.join(self.ssl_certificates_location, f'{name}_{self.id}.key'),
+                os.path.join(self.ssl_certificates_location, f'{name}_{self.id}.csr'),
+            )
+        ca_certificate_path = os.path.join(self.ssl_certificates_location, 'ca.cert')
+
+        required = [ca_certificate_path]
+        for private_key_path, certificate_path in paths.values():
+            required.extend(
+                [private_key_path, certificate_path.replace('.csr', '.cert')]
+            )
+
+        now = time.time()
+        for path in required:
+            if not os.path.exists(path) or now - os.path.getmtime(path) > max_age:
+                return False
+
+        ca_certificate = x509.load_pem_x509_certificate(
+            self.load_certificate(ca_certificate_path)
+        )
+        for _, certificate_path in paths.values():
+            certificate = x509.load_pem_x509_certificate(
+                self.load_certificate(certificate_path.replace('.csr', '.cert'))
+            )
+            try:
+                certificate.verify_directly_issued_by(ca_certificate)
+            except (ValueError, TypeError, InvalidSignature):
+                return False
+
+        self.load_key_and_csr(*paths['client'], *paths['server'])
+        self.ca_certificate_path = ca_certificate_path
+        return True
+
     # ----------------------------------------------------------------------
     def load_key_and_csr(
         self,
@@ -580,29 +706,21 @@ class CertificateAuthority:
         -----
         The context requires a Certificate Authority (CA) certificate to verify clients.
         The verification mode is set to require SSL certificates (CERT_REQUIRED).
+        New contexts are created on every call, only the CA certificate is cached.
         """
-        # Create a default SSL context for the client, specifying that it's intended for server authentication
-        ssl_context_client = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        # Load and set the client's certificate and private key for the SSL context
-        ssl_context_client.load_cert_chain(
+        # Client context, intended for server authentication
+        ssl_context_client = get_ssl_context(
+            ssl.Purpose.SERVER_AUTH,
             certfile=self.certificate_signed_paths['client'],
             keyfile=self.private_key_paths['client'],
+            cafile=self.ca_certificate_path,
         )
-        # Load and set the Certificate Authority (CA) certificate to verify the client's server certificate
-        ssl_context_client.load_verify_locations(cafile=self.ca_certificate_path)
-        # Set the verification mode of the SSL context to require SSL certificates (CERT_REQUIRED).
-        ssl_context_client.verify_mode = ssl.CERT_REQUIRED
-
-        # Create a default SSL context for the server, specifying that it's intended for client authentication
-        ssl_context_server = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-        # Load and set the server's certificate and private key for the SSL context
-        ssl_context_server.load_cert_chain(
+        # Server context, intended for client authentication
+        ssl_context_server = get_ssl_context(
+            ssl.Purpose.CLIENT_AUTH,
             certfile=self.certificate_signed_paths['server'],
             keyfile=self.private_key_paths['server'],
+            cafile=self.ca_certificate_path,
         )
-        # Load and set the Certificate Authority (CA) certificate to verify the server's client certificate
-        ssl_context_server.load_verify_locations(cafile=self.ca_certificate_path)
-        # Set the verification mode of the SSL context to require SSL certificates (CERT_REQUIRED).
-        ssl_context_server.verify_mode = ssl.CERT_REQUIRED
 
         return ssl_context_client, ssl_context_server
@@ -0,0 +1,308 @@
+"""
+==================
+In-process Streams
+==================
+
+This module provides an in-memory replacement for the TCP streams used by
+ChaskiNode when every node lives in the same process, as in the test suite.
+`start_inproc_server` and `open_inproc_connection` mirror `asyncio.start_server`
+and `asyncio.open_connection`, returning regular `asyncio.StreamReader` and
+`asyncio.StreamWriter` objects, so the framing and the rest of the node logic
+are unchanged while the kernel socket path is skipped.
+
+Servers are registered by address in a process-wide table. Flow control is
+preserved: when a reader buffer fills up, the writer on the other end pauses
+and `drain` blocks until the reader catches up.
+"""
+
+import asyncio
+import errno
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# Servers currently accepting in-process connections, keyed by (ip, port)
+INPROC_SERVERS: Dict[Tuple[str, int], 'InprocServer'] = {}
+
+# Source ports for the client side of in-process connections, above the TCP range
+_client_ports = count(1 << 16)
+
+
+########################################################################
+class InprocTransport(asyncio.Transport):
+    """
+    One end of an in-memory, bidirectional byte stream.
+
+    Data written to this transport is delivered synchronously to the protocol of
+    the peer transport. Closing one end delivers an end of stream to the peer,
+    and a later write from the peer loses the connection with a
+    `ConnectionResetError`, as a TCP connection would.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop running both ends of the stream.
+    sockname : Tuple[str, int]
+        The local address reported by `get_extra_info('sockname')`.
+    peername : Tuple[str, int]
+        The remote address reported by `get_extra_info('peername')`.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        sockname: Tuple[str, int],
+        peername: Tuple[str, int],
+    ) -> None:
+        super().__init__({'sockname': sockname, 'peername': peername})
+        self._loop = loop
+        self._protocol: Optional[asyncio.Protocol] = None
+        self._peer: Optional['InprocTransport'] = None
+        self._closing = False
+        self._reading = True
+
+    # ----------------------------------------------------------------------
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        """Set the protocol that receives the data written by the peer."""
+        self._protocol = protocol
+
+    # ----------------------------------------------------------------------
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        """Return the protocol that receives the data written by the peer."""
+        return self._protocol
+
+    # ----------------------------------------------------------------------
+    def write(self, data: bytes) -> None:
+        """Deliver `data` to the protocol of the peer transport."""
+        if self._closing or not data:
+            return
+        if self._peer._closing:
+            # The peer is gone, like a TCP send after the other end closed
+            self._closing = True
+            self._loop.call_soon(
+                self._protocol.connection_lost, ConnectionResetError('Connection lost')
+            )
+            return
+        self._peer._protocol.data_received(bytes(data))
+
+    # ----------------------------------------------------------------------
+    def is_closing(self) -> bool:
+        """Return True if the stream is closed or being closed."""
+        return self._closing
+
+    # ----------------------------------------------------------------------
+    def close(self) -> None:
+        """Close this end of the stream, the peer protocol sees an end of stream."""
+        if self._closing:
+            return
+        self._closing = True
+        self._loop.call_soon(self._protocol.connection_lost, None)
+        if not self._peer._closing:
+            self._loop.call_soon(self._peer._eof_received)
+
+    # ----------------------------------------------------------------------
+    def _eof_received(self) -> None:
+        """Deliver an end of stream, the transport closes unless the protocol keeps it open."""
+        if not self._closing and not self._protocol.eof_received():
+            self.close()
+
+    # ----------------------------------------------------------------------
+    def abort(self) -> None:
+        """Close the stream immediately, equivalent to `close`."""
+        self.close()
+
+    # ----------------------------------------------------------------------
+    def can_write_eof(self) -> bool:
+        """Half-closed streams are not supported."""
+        return False
+
+    # ----------------------------------------------------------------------
+    def get_write_buffer_size(self) -> int:
+        """Data is delivered on write, so nothing is ever buffered."""
+        return 0
+
+    # ----------------------------------------------------------------------
+    def set_write_buffer_limits(
+        self, high: Optional[int] = None, low: Optional[int] = None
+    ) -> None:
+        """Data is delivered on write, so the limits have no effect."""
+
+    # ----------------------------------------------------------------------
+    def is_reading(self) -> bool:
+        """Return True unless the local reader asked to pause."""
+        return self._reading
+
+    # ----------------------------------------------------------------------
+    def pause_reading(self) -> None:
+        """Pause the writer at the other end until the local reader catches up."""
+        if self._reading:
+            self._reading = False
+            if not self._peer._closing:
+                self._peer._protocol.pause_writing()
+
+    # ----------------------------------------------------------------------
+    def resume_reading(self) -> None:
+        """Resume the writer at the other end."""
+        if not self._reading:
+            self._reading = True
+            if not self._peer._closing:
+                self._peer._protocol.resume_writing()
+
+
+########################################################################
+class InprocServer:
+    """
+    A server accepting in-process connections on a registered address.
+
+    Exposes the subset of the `asyncio.Server` interface used by ChaskiNode.
+
+    Parameters
+    ----------
+    client_connected_cb : Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+        Called with the reader and writer of every accepted connection.
+    ip : str
+        The IP address the server is registered under.
+    port : int
+        The port the server is registered under.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        client_connected_cb: Callable[
+            [asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]
+        ],
+        ip: str,
+        port: int,
+    ) -> None:
+        self.client_connected_cb = client_connected_cb
+        self.address = (ip, port)
+        self.sockets = ()
+        self._closed = asyncio.Event()
+
+    # ----------------------------------------------------------------------
+    def is_serving(self) -> bool:
+        """Return True while the server accepts connections."""
+        return INPROC_SERVERS.get(self.address) is self
+
+    # ----------------------------------------------------------------------
+    def close(self) -> None:
+        """Stop accepting connections, established streams stay open."""
+        if self.is_serving():
+            del INPROC_SERVERS[self.address]
+        self._closed.set()
+
+    # ----------------------------------------------------------------------
+    async def wait_closed(self) -> None:
+        """Wait until the server is closed."""
+        await self._closed.wait()
+
+    # ----------------------------------------------------------------------
+    async def serve_forever(self) -> None:
+        """Wait until the server is closed, connections are accepted meanwhile."""
+        await self._closed.wait()
+
+    # ----------------------------------------------------------------------
+    async def __aenter__(self) -> 'InprocServer':
+        return self
+
+    # ----------------------------------------------------------------------
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+        await self.wait_closed()
+
+
+# ----------------------------------------------------------------------
+async def start_inproc_server(
+    client_connected_cb: Callable[
+        [asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]
+    ],
+    ip: str,
+    port: int,
+) -> InprocServer:
+    """
+    Register an in-process server, the counterpart of `asyncio.start_server`.
+
+    Parameters
+    ----------
+    client_connected_cb : Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+        Called with the reader and writer of every accepted connection.
+    ip : str
+        The IP address to register the server under.
+    port : int
+        The port to register the server under.
+
+    Returns
+    -------
+    InprocServer
+        The registered server.
+
+    Raises
+    ------
+    OSError
+        If another in-process server is already registered at the address.
+    """
+    if (ip, port) in INPROC_SERVERS:
+        raise OSError(errno.EADDRINUSE, f"Address already in use: {ip}:{port}")
+    server = InprocServer(client_connected_cb, ip, port)
+    INPROC_SERVERS[(ip, port)] = server
+    return server
+
+
+# ----------------------------------------------------------------------
+async def open_inproc_connection(
+    ip: str,
+    port: int,
+    local_ip: str = '127.0.0.1',
+) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Connect to an in-process server, the counterpart of `asyncio.open_connection`.
+
+    Parameters
+    ----------
+    ip : str
+        The IP address of the server.
+    port : int
+        The port of the server.
+    local_ip : str, optional
+        The IP address reported as the client side of the connection.
+
+    Returns
+    -------
+    Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+        The reader and writer of the client side of the connection.
+
+    Raises
+    ------
+    ConnectionRefusedError
+        If no in-process server is registered at the address.
+    """
+    server = INPROC_SERVERS.get((ip, port))
+    if server is None:
+        raise ConnectionRefusedError(
+            errno.ECONNREFUSED, f"Connect call failed {(ip, port)}"
+        )
+
+    loop = asyncio.get_running_loop()
+    client_address = (local_ip, next(_client_ports))
+    client_transport = InprocTransport(loop, client_address, server.address)
+    server_transport = InprocTransport(loop, server.address, client_address)
+    client_transport._peer = server_transport
+    server_transport._peer = client_transport
+
+    # Server side, the protocol creates the writer and schedules the callback
+    server_reader = asyncio.StreamReader()
+    server_protocol = asyncio.StreamReaderProtocol(
+        server_reader, server.client_connected_cb
+    )
+    server_transport.set_protocol(server_protocol)
+
+    # Client side, built as `asyncio.open_connection` does
+    reader = asyncio.StreamReader()
+    protocol = asyncio.StreamReaderProtocol(reader)
+    client_transport.set_protocol(protocol)
+
+    server_protocol.connection_made(server_transport)
+    protocol.connection_made(client_transport)
+    writer = asyncio.StreamWriter(client_transport, protocol, reader, loop)
+    return reader, writer
@@ -1,6 +1,5 @@
 import os
 from queue import Empty
-import time
 from typing import Optional, Any
 
 from kombu import transport
@@ -33,7 +32,8 @@ class ChaskiChannel(Channel):
         self.producer.connect(
             os.getenv("CHASKI_STREAMER_ROOT", "*ChaskiStreamer@127.0.0.1:65433")
         )
-        time.sleep(0.5)
+        # Block until the handshake with the root registers its edge
+        self.producer.wait_connected()
 
         self.consumer: Optional[ChaskiStreamerSync] = None
 
@@ -0,0 +1,289 @@
+"""
+===============================
+Shared pytest configuration
+===============================
+
+Runs the asynchronous tests on `uvloop` when it is installed, its libuv
+backend lowers the per-callback cost of the loopback round trips that
+dominate this suite.
+
+Tests that rely on `nest_asyncio`, such as the `ChaskiRemote` ones, can not
+run on `uvloop` and must be marked with `no_uvloop`.
+
+Tests that need a Certificate Authority use the `chaski_ca_address` fixture,
+a single `ChaskiCA` is started for the whole session. The Celery tests use the
+`streamer_root` fixture instead of a `chaski_streamer_root` process. Tests
+that write keys, CSRs or certificates use the `certificates_folder` fixture, so
+nothing is written in the working directory.
+
+File transfer tests use the `transfer_folders` fixture, the input files are
+generated once per session instead of being read from a `testdir` folder.
+
+Test cases find the transport for their nodes in `self.transport`, in-process
+streams by default, TCP for tests marked with `tcp` and Unix domain sockets for
+tests marked with `unix`.
+"""
+
+import sys
+import mmap
+import socket
+import asyncio
+import threading
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def event_loop_policy(request):
+    """
+    Install the `uvloop` event loop policy for the duration of a test.
+
+    The policy is only replaced when `uvloop` is available, the platform is
+    not Windows, and the test is not marked with `no_uvloop`. The previous
+    policy is restored afterwards.
+    """
+    if (
+        uvloop is None
+        or sys.platform == 'win32'
+        or request.node.get_closest_marker('no_uvloop')
+    ):
+        yield
+        return
+
+    policy = asyncio.get_event_loop_policy()
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    yield
+    asyncio.set_event_loop_policy(policy)
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def chaski_transport(request):
+    """
+    Select the transport used by the nodes of a test case.
+
+    Sets `self.transport` to 'tcp' for tests marked with `tcp`, to 'unix' for
+    tests marked with `unix` and to 'inproc' otherwise, so most tests exercise
+    the protocol without the kernel TCP path while the marked ones keep
+    end-to-end socket coverage.
+    """
+    if request.instance is not None:
+        request.instance.transport = next(
+            (
+                marker
+                for marker in ('tcp', 'unix')
+                if request.node.get_closest_marker(marker)
+            ),
+            'inproc',
+        )
+
+
+# ----------------------------------------------------------------------
+def _serve_in_thread(create_node):
+    """
+    Run a node on its own event loop in a background thread.
+
+    Every asynchronous test case runs on a separate loop, so nodes shared by
+    the session live on a dedicated one. `create_node` is called inside that
+    loop, the node is returned once its servers are listening, together with
+    a function that stops it and the thread.
+    """
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    nodes = []
+
+    async def start():
+        node = create_node()
+        # Wait for the servers to listen before exposing the address
+        await asyncio.wait_for(node.serving_event.wait(), timeout=10)
+        nodes.append(node)
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(start())
+        ready.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    ready.wait(timeout=10)
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(nodes[0].stop(), loop).result(timeout=10)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+
+    return nodes[0], stop
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def chaski_ca(tmp_path_factory):
+    """
+    Provide a Certificate Authority shared by the session.
+
+    The `ChaskiCA` is started once, on a free port, in a background thread
+    with its own event loop. It is stopped when the session finishes.
+
+    Yields the address of the CA and a directory for the certificates it
+    signs, certificates signed by the CA of a previous session are not
+    valid for this one.
+    """
+    from chaski.ca import ChaskiCA
+
+    ca, stop = _serve_in_thread(
+        lambda: ChaskiCA(
+            port=0,
+            ssl_certificates_location=str(tmp_path_factory.mktemp('chaski_ca')),
+        )
+    )
+    yield ca.address, str(tmp_path_factory.mktemp('certs'))
+    stop()
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def streamer_root():
+    """
+    Provide the root streamer used by the Celery transport and backend.
+
+    The root runs in-process, as `chaski_streamer_root` would, on the default
+    address 127.0.0.1:65433. If a root is already listening there, started
+    by hand for a Celery worker, it is used instead. Yields its address.
+    """
+    from chaski.streamer import ChaskiStreamer
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        if sock.connect_ex(('127.0.0.1', 65433)) == 0:
+            yield '*ChaskiStreamer@127.0.0.1:65433'
+            return
+
+    root, stop = _serve_in_thread(
+        lambda: ChaskiStreamer(
+            port=65433,
+            name='ChaskiRoot',
+            root=True,
+            paired=True,
+        )
+    )
+    yield root.address
+    stop()
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def chaski_ca_address(request, chaski_ca):
+    """
+    Expose the session Certificate Authority to the test case.
+
+    Sets `self.chaski_ca` to the address of the CA and `self.chaski_ca_certs`
+    to the directory where the nodes should store their certificates.
+    """
+    request.instance.chaski_ca, request.instance.chaski_ca_certs = chaski_ca
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def certificates_folder(request, tmp_path):
+    """
+    Expose an empty directory for the certificates written by the test case.
+
+    Sets `self.certificates_folder` to a temporary directory of the test, keys,
+    CSRs and certificates never end up in the working directory.
+    """
+    request.instance.certificates_folder = str(tmp_path)
+
+
+# ----------------------------------------------------------------------
+def _create_dummy_file(folder, filename, size):
+    """
+    Create a sparse input file, hash it and map it read-only.
+
+    Returns the digest of the file, with the default streamer hash algorithm,
+    and its map.
+    """
+    from chaski.streamer import DEFAULT_HASH_ALGORITHM, ChaskiStreamer
+
+    with open(folder / filename, 'wb') as file:
+        file.truncate(int(size))
+    digest = ChaskiStreamer.get_hash(folder / filename, algorithm=DEFAULT_HASH_ALGORITHM)
+    with open(folder / filename, 'rb') as file:
+        return digest, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def dummy_files(tmp_path_factory):
+    """
+    Create the input files used by the file transfer tests.
+
+    The files are generated once per session as sparse files of the expected
+    size, the transfers are validated by hash so their content does not need
+    to persist between runs. Their digests, with the default streamer hash
+    algorithm, are computed once as well so the producers can skip hashing.
+    Every file is memory-mapped read-only for the whole session, the tests
+    push the maps instead of opening the files again. The 100MB file is only
+    created by `large_dummy_files`, for the tests marked with `slow`.
+
+    Yields the directory that contains them, a dictionary with the digest
+    of each file and a dictionary with the map of each file.
+    """
+    folder = tmp_path_factory.mktemp('input')
+    hashes = {}
+    maps = {}
+    for filename, size in [
+        ('dummy_1KB.data', 1e3),
+        ('dummy_10KB.data', 10e3),
+        ('dummy_100KB.data', 100e3),
+        ('dummy_1MB.data', 1e6),
+        ('dummy_10MB.data', 10e6),
+    ]:
+        hashes[filename], maps[filename] = _create_dummy_file(folder, filename, size)
+
+    yield folder, hashes, maps
+
+    for mapped in maps.values():
+        mapped.close()
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def large_dummy_files(dummy_files):
+    """
+    Add the 100MB input file to the session dummy files.
+
+    Only requested by `transfer_folders` for tests marked with `slow`, so
+    the default run never creates, hashes or maps it.
+    """
+    folder, hashes, maps = dummy_files
+    filename = 'dummy_100MB.data'
+    hashes[filename], maps[filename] = _create_dummy_file(folder, filename, 100e6)
+    yield
+    # The map is closed with the others by `dummy_files`
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def transfer_folders(request, dummy_files, tmp_path):
+    """
+    Expose the file transfer folders to the test case.
+
+    Sets `self.input_folder` to the session dummy files, `self.input_hashes`
+    to their digests, `self.input_maps` to their read-only maps and
+    `self.output_folder` to an empty directory for the received files.
+    Tests marked with `slow` also get the 100MB file.
+    """
+    if request.node.get_closest_marker('slow'):
+        request.getfixturevalue('large_dummy_files')
+
+    folder, hashes, maps = dummy_files
+    request.instance.input_folder = str(folder)
+    request.instance.input_hashes = hashes
+    request.instance.input_maps = maps
+    request.instance.output_folder = str(tmp_path)
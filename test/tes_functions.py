@@ -17,11 +17,15 @@ TestFunctions : unittest.IsolatedAsyncioTestCase
 
 import os
 import ssl
+import ipaddress
+import time
 import asyncio
 import unittest
+import pytest
 from chaski.node import Message
 from chaski.streamer import ChaskiStreamer
-from chaski.utils.auto import run_transmission, create_nodes
+from chaski.utils.auto import run_transmission, create_nodes, stop_nodes
+from chaski.utils.certificate_authority import CertificateAuthority, get_ssl_context
 
 
 ########################################################################
@@ -30,21 +34,82 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
 
     ip = '127.0.0.1'
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Build the SSL contexts for the pre-signed test certificates once.
+
+        The contexts only depend on the files in `certs_ca/`, so they are
+        created once for the whole class and mapped by certificate UUID to
+        a `(server_context, client_context)` tuple. Certificates that are
+        missing are recorded in `missing_certificates`, `test_ssl_certificate`
+        is skipped with their paths instead of failing on a lookup.
+        """
+        cls.ssl_contexts = {}
+        cls.missing_certificates = []
+        for uuid_ in (
+            '414c5aef-a2dd-4b49-ad57-13a5c156c0af',
+            'ba0e12cc-8806-46da-ab0f-8eb7177c106a',
+        ):
+            paths = [
+                f'certs_ca/{side}_{uuid_}.{extension}'
+                for side in ('server', 'client')
+                for extension in ('cert', 'key')
+            ] + ['certs_ca/ca.cert']
+            missing = [path for path in paths if not os.path.exists(path)]
+            if missing:
+                cls.missing_certificates.extend(missing)
+                continue
+            cls.ssl_contexts[uuid_] = (
+                get_ssl_context(
+                    ssl.Purpose.CLIENT_AUTH,
+                    certfile=f'certs_ca/server_{uuid_}.cert',
+                    keyfile=f'certs_ca/server_{uuid_}.key',
+                    cafile='certs_ca/ca.cert',
+                ),
+                get_ssl_context(
+                    ssl.Purpose.SERVER_AUTH,
+                    certfile=f'certs_ca/client_{uuid_}.cert',
+                    keyfile=f'certs_ca/client_{uuid_}.key',
+                    cafile='certs_ca/ca.cert',
+                ),
+            )
+
     # ----------------------------------------------------------------------
     async def _close_nodes(self, nodes: list['ChaskiNode']) -> None:
         """
         Close all ChaskiNode instances in the provided list.
 
-        This method iterates through each ChaskiNode instance in the given list and
-        stops their operation by invoking the `stop` method on each node.
+        The nodes are stopped concurrently by `stop_nodes`, which waits for all of
+        them and then raises the first error of a failing `stop`.
 
         Parameters
         ----------
         nodes : list of ChaskiNode
             A list containing instances of ChaskiNode that need to be stopped.
         """
-        for node in nodes:
-            await node.stop()
+        await stop_nodes(nodes)
+
+    # ----------------------------------------------------------------------
+    async def _wait_for_edges(
+        self, node: 'ChaskiNode', count: int, timeout: float = 2
+    ) -> None:
+        """
+        Wait until a ChaskiNode has registered a minimum number of edges.
+
+        Parameters
+        ----------
+        node : ChaskiNode
+            The node whose edges are monitored.
+        count : int
+            The minimum number of edges to wait for.
+        timeout : float, optional
+            Maximum time in seconds to wait for each new edge, by default 2.
+        """
+        while len(node.edges) < count:
+            node.connected_event.clear()
+            await asyncio.wait_for(node.connected_event.wait(), timeout)
 
     # ----------------------------------------------------------------------
     async def test_ping(self) -> None:
@@ -54,8 +119,8 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         This test method performs the following steps:
         1. Create three ChaskiNodes.
         2. Connect nodes 1 and 2 to node 0.
-        3. Ping the first edge of node 0 and wait.
-        4. Ping the second edge of node 0 with a larger size and wait.
+        3. Ping the first edge of node 0 and wait for its pong.
+        4. Ping the second edge of node 0 with a delayed response and wait for its pong.
         5. Assert that the latency of the second edge is greater than the first.
         6. Reset the latencies of both edges.
         7. Assert that the latencies of both edges are equal after resetting.
@@ -73,12 +138,10 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         nodes = await create_nodes(3, self.ip)
         await nodes[1].connect(nodes[0])
         await nodes[2].connect(nodes[0])
-        await asyncio.sleep(0.3)
+        await self._wait_for_edges(nodes[0], 2)
 
-        await nodes[0].ping(nodes[0].edges[0])
-        await asyncio.sleep(1)
-        await nodes[0].ping(nodes[0].edges[1], size=100000)
-        await asyncio.sleep(1)
+        await nodes[0].ping(nodes[0].edges[0], timeout=2)
+        await nodes[0].ping(nodes[0].edges[1], response_delay=0.05, timeout=2)
 
         self.assertGreater(
             nodes[0].edges[1].latency,
@@ -107,7 +170,7 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         1. Create two ChaskiNodes.
         2. Connect nodes[1] to nodes[0].
         3. Assert that the address of the first edge of node[0] matches the provided IP.
-        4. Assert that the local address of the first edge of node[0] is set to port 65440.
+        4. Assert that the local address of the first edge of node[0] is set to its server port.
         5. Close the nodes.
 
         Assertions
@@ -121,7 +184,7 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         """
         nodes = await create_nodes(2, self.ip)
         await nodes[1].connect(nodes[0])
-        await asyncio.sleep(0.3)
+        await self._wait_for_edges(nodes[0], 1)
 
         self.assertEqual(
             nodes[0].edges[0].address[0],
@@ -131,8 +194,8 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(
             nodes[0].edges[0].local_address[1],
-            65440,
-            "Local address of the edge should be 65440",
+            nodes[0].port,
+            "Local address of the edge should be the server port",
         )
 
         await self._close_nodes(nodes)
@@ -169,6 +232,8 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         )
 
     # ----------------------------------------------------------------------
+    @pytest.mark.slow
+    @pytest.mark.usefixtures('certificates_folder')
     async def test_ssl_certificate(self) -> None:
         """
         Test the SSL certificate configuration for secure communication.
@@ -177,15 +242,12 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         of SSL/TLS certificates and contexts for both the server and
         client sides. The steps are as follows:
 
-        1. Configure server SSL context to authenticate clients,
-           load server certificate and key, and verify with CA certificate.
-        2. Configure client SSL context to authenticate server,
-           load client certificate and key, and verify with CA certificate.
-        3. Initialize a ChaskiStreamer instance for the producer with SSL context.
-        4. Configure a second server SSL context for another client-server pair.
-        5. Configure a second client SSL context for server authentication.
-        6. Initialize another ChaskiStreamer instance for the consumer with SSL context.
-        7. Run the transmission between producer and consumer to validate secure communication.
+        1. Get the server and client SSL contexts for the producer and the
+           consumer, built once in `setUpClass` from their certificates and keys
+           and verified with the CA certificate.
+        2. Initialize a ChaskiStreamer instance for the producer with SSL context.
+        3. Initialize another ChaskiStreamer instance for the consumer with SSL context.
+        4. Run the transmission between producer and consumer to validate secure communication.
 
         Assertions
         ----------
@@ -198,69 +260,37 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         instances are correctly set up to allow secure communication between
         producer and consumer nodes.
         """
+        if self.missing_certificates:
+            self.skipTest(
+                f"Pre-signed test certificates not found: {', '.join(sorted(set(self.missing_certificates)))}"
+            )
+
         uuid1 = '414c5aef-a2dd-4b49-ad57-13a5c156c0af'
         uuid2 = 'ba0e12cc-8806-46da-ab0f-8eb7177c106a'
 
-        # Configure the server SSL context for client authentication,
-        # load the server's certificate and key, and set up the CA certificate for verification.
-        server_ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-        server_ssl_context.load_cert_chain(
-            certfile=f'certs_ca/server_{uuid1}.cert',
-            keyfile=f'certs_ca/server_{uuid1}.key',
-        )
-        server_ssl_context.load_verify_locations(cafile='certs_ca/ca.cert')
-        server_ssl_context.verify_mode = ssl.CERT_REQUIRED
-
-        # Configure the client SSL context for server authentication,
-        # load the client's certificate and key, and set up the CA certificate for verification.
-        client_ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        client_ssl_context.load_cert_chain(
-            certfile=f'certs_ca/client_{uuid1}.cert',
-            keyfile=f'certs_ca/client_{uuid1}.key',
-        )
-        client_ssl_context.load_verify_locations(cafile='certs_ca/ca.cert')
-        client_ssl_context.verify_mode = ssl.CERT_REQUIRED
+        # Server and client SSL contexts for the producer and the consumer,
+        # built once for the whole class in `setUpClass`.
+        server_ssl_context, client_ssl_context = self.ssl_contexts[uuid1]
+        server_ssl_context2, client_ssl_context2 = self.ssl_contexts[uuid2]
 
         # Initialize the ChaskiStreamer instance for the producer, configuring SSL contexts
         # for secure communication, subscriptions, and other parameters.
         producer = ChaskiStreamer(
-            # port=65433,
             name='Producer',
             subscriptions=['topic1'],
             reconnections=None,
-            ssl_certificates_location='certs_ca',
+            ssl_certificates_location=self.certificates_folder,
             ssl_context_server=server_ssl_context,
             ssl_context_client=client_ssl_context,
         )
 
-        # Configure the second server SSL context for client authentication,
-        # load the second server's certificate and key, and set up the CA certificate for verification.
-        server_ssl_context2 = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-        server_ssl_context2.load_cert_chain(
-            certfile=f'certs_ca/server_{uuid2}.cert',
-            keyfile=f'certs_ca/server_{uuid2}.key',
-        )
-        server_ssl_context2.load_verify_locations(cafile='certs_ca/ca.cert')
-        server_ssl_context2.verify_mode = ssl.CERT_REQUIRED
-
-        # Configure the second client SSL context for server authentication,
-        # load the client's certificate and key, and set up the CA certificate for verification.
-        client_ssl_context2 = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        client_ssl_context2.load_cert_chain(
-            certfile=f'certs_ca/client_{uuid2}.cert',
-            keyfile=f'certs_ca/client_{uuid2}.key',
-        )
-        client_ssl_context2.load_verify_locations(cafile='certs_ca/ca.cert')
-        client_ssl_context2.verify_mode = ssl.CERT_REQUIRED
-
         # Initialize the ChaskiStreamer instance for the consumer, configuring SSL contexts
         # for secure communication, subscriptions, and other parameters.
         consumer = ChaskiStreamer(
-            # port=65434,
             name='Consumer',
             subscriptions=['topic1'],
             reconnections=None,
-            ssl_certificates_location='certs_ca',
+            ssl_certificates_location=self.certificates_folder,
             ssl_context_server=server_ssl_context2,
             ssl_context_client=client_ssl_context2,
         )
@@ -268,6 +298,8 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         await run_transmission(producer, consumer, parent=self)
 
     # ----------------------------------------------------------------------
+    @pytest.mark.slow
+    @pytest.mark.usefixtures('chaski_ca_address')
     async def test_ssl_certificate_CA(self) -> None:
         """
         Test requesting SSL certificates from the Certificate Authority (CA).
@@ -293,31 +325,30 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         communication channels.
         """
         producer = ChaskiStreamer(
-            # port=65433,
             name='Producer',
             subscriptions=['topic1'],
             reconnections=None,
-            ssl_certificates_location='certs_ca',
+            ssl_certificates_location=self.chaski_ca_certs,
         )
 
         consumer = ChaskiStreamer(
-            # port=65434,
             name='Consumer',
             subscriptions=['topic1'],
             reconnections=None,
-            ssl_certificates_location='certs_ca',
+            ssl_certificates_location=self.chaski_ca_certs,
         )
 
-        await producer.request_ssl_certificate(
-            os.getenv('CHASKI_CERTIFICATE_AUTHORITY', 'ChaskiCA@127.0.0.1:65432')
-        )
-        await consumer.request_ssl_certificate(
-            os.getenv('CHASKI_CERTIFICATE_AUTHORITY', 'ChaskiCA@127.0.0.1:65432')
+        # Both requests are independent, the CA serves them concurrently
+        await asyncio.gather(
+            producer.request_ssl_certificate(self.chaski_ca),
+            consumer.request_ssl_certificate(self.chaski_ca),
         )
 
         await run_transmission(producer, consumer, parent=self)
 
     # ----------------------------------------------------------------------
+    @pytest.mark.slow
+    @pytest.mark.usefixtures('chaski_ca_address')
     async def test_ssl_certificate_CA_inline(self) -> None:
         """
         Test the inline requesting of SSL certificates from the Certificate Authority (CA).
@@ -346,70 +377,141 @@ class TestFunctions(unittest.IsolatedAsyncioTestCase):
         requesting SSL certificates from the CA and use them successfully for secure communications.
         """
         producer = ChaskiStreamer(
-            port=65433,
             name='Producer',
             subscriptions=['topic1'],
             reconnections=None,
-            ssl_certificates_location='certs_ca',
-            request_ssl_certificate=os.getenv(
-                'CHASKI_CERTIFICATE_AUTHORITY', 'ChaskiCA@127.0.0.1:65432'
-            ),
+            ssl_certificates_location=self.chaski_ca_certs,
+            ssl_certificate_cache_ttl=30,
+            request_ssl_certificate=self.chaski_ca,
         )
 
         consumer = ChaskiStreamer(
-            port=65434,
             name='Consumer',
             subscriptions=['topic1'],
             reconnections=None,
-            ssl_certificates_location='certs_ca',
-            request_ssl_certificate=os.getenv(
-                'CHASKI_CERTIFICATE_AUTHORITY', 'ChaskiCA@127.0.0.1:65432'
-            ),
+            ssl_certificates_location=self.chaski_ca_certs,
+            ssl_certificate_cache_ttl=30,
+            request_ssl_certificate=self.chaski_ca,
         )
 
+        # The certificates are requested in the background, wait for both
+        # nodes to load their SSL contexts before connecting them.
+        async def certificates_loaded():
+            while not (producer.ssl_context_server and consumer.ssl_context_server):
+                await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(certificates_loaded(), timeout=10)
         await run_transmission(producer, consumer, parent=self)
 
     # ----------------------------------------------------------------------
+    @pytest.mark.usefixtures('certificates_folder')
     async def test_ssl_certificate_CA_off(self) -> None:
         """
-        Test the behavior of requesting SSL certificates from a non-existent CA.
+        Test the behavior of requesting SSL certificates from an unresponsive CA.
 
-        This test validates that the system can handle errors when requesting
-        SSL/TLS certificates from an incorrect or non-existent Certificate Authority (CA).
-        It ensures proper error handling and logging for such requests.
+        This test validates that a request to a Certificate Authority (CA) that
+        accepts the connection but never signs the request fails within
+        `request_ssl_certificate_timeout`, instead of waiting forever.
 
         Steps
         -----
-        1. Attempt to initialize a ChaskiStreamer instance for the producer with an incorrect CA address.
-        2. Intentionally cause an error by using a non-existent CA address.
-        3. Ensure that an exception is raised.
-        4. Verify appropriate error handling and logging mechanisms are invoked.
+        1. Start a listener that accepts connections and never replies.
+        2. Initialize a ChaskiStreamer instance for the producer with a 0.2 seconds timeout.
+        3. Request the SSL certificate from the listener.
+        4. Ensure that a `ConnectionError` is raised in about 0.2 seconds.
 
         Assertions
         ----------
         AssertionError
-            The test passes if the SSL certificate request raises an error due to an incorrect CA address.
+            If the request does not raise a `ConnectionError`, or takes longer than a second.
 
         Notes
         -----
         This test ensures robustness by checking that the streamer correctly handles failed SSL certificate
-        requests due to incorrect CA details.
+        requests due to an unresponsive CA.
         """
-        try:
-            ChaskiStreamer(
-                port=65433,
-                name='Producer',
-                subscriptions=['topic1'],
-                reconnections=None,
-                ssl_certificates_location='certs_ca',
-                request_ssl_certificate='ChaskiCA@127.0.0.1:1111',
-            )
-        except:
-            self.assertTrue(
-                True,
-                "SSL certificate request should raise an error with an incorrect CA address.",
+        # Keep the accepted streams open, the listener never answers through them
+        streams = []
+        listener = await asyncio.start_server(
+            lambda reader, writer: streams.append(writer), self.ip, 0
+        )
+        port = listener.sockets[0].getsockname()[1]
+
+        producer = ChaskiStreamer(
+            name='Producer',
+            subscriptions=['topic1'],
+            reconnections=None,
+            ssl_certificates_location=self.certificates_folder,
+            request_ssl_certificate_timeout=0.2,
+        )
+
+        start = time.perf_counter()
+        with self.assertRaises(
+            ConnectionError,
+            msg="SSL certificate request should fail with an unresponsive CA.",
+        ):
+            await producer.request_ssl_certificate(f'ChaskiCA@{self.ip}:{port}')
+        self.assertLess(
+            time.perf_counter() - start,
+            1,
+            "SSL certificate request should fail after the 0.2 seconds timeout.",
+        )
+
+        await producer.stop()
+        for writer in streams:
+            writer.close()
+        listener.close()
+        await listener.wait_closed()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.usefixtures('certificates_folder')
+    async def test_ssl_restart_failure(self) -> None:
+        """
+        Test that a node that can not restart with its SSL context reports it.
+
+        The port of the node is taken by another listener, so the servers can
+        not be bound again and the restart must fail within
+        `request_ssl_certificate_timeout` instead of leaving the node stopped.
+        """
+        ca = CertificateAuthority(
+            'Test-ID',
+            ipaddress.IPv4Address(self.ip),
+            ssl_certificates_location=self.certificates_folder,
+            ssl_certificate_attributes={
+                'Country Name': "CO",
+                'Locality Name': "Manizales",
+                'Organization Name': "DunderLab",
+                'State or Province Name': "Caldas",
+                'Common Name': "Chaski-Confluent",
+            },
+        )
+        ca.setup_certificate_authority()
+        ca.generate_key_and_csr()
+        for name in ('client', 'server'):
+            ca.write_certificate(
+                ca.certificate_signed_paths[name],
+                ca.sign_csr(ca.load_certificate(ca.certificate_paths[name])),
             )
 
+        listener = await asyncio.start_server(lambda reader, writer: None, self.ip, 0)
+        port = listener.sockets[0].getsockname()[1]
+
+        producer = ChaskiStreamer(
+            name='Producer',
+            port=port,
+            run=False,
+            reconnections=None,
+            request_ssl_certificate_timeout=0.2,
+        )
+        with self.assertRaises(
+            ConnectionError,
+            msg="The restart should fail while the port is taken.",
+        ):
+            await producer._restart_with_ssl_context(ca)
+
+        await producer.stop()
+        listener.close()
+        await listener.wait_closed()
 
 if __name__ == '__main__':
     unittest.main()
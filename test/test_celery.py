@@ -1,10 +1,15 @@
+import os
 import sys
 import unittest
 
-sys.path.append('tasks')
+import pytest
+
+# The Celery app lives in test/tasks, resolved once so the tests run from any directory
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tasks'))
 
 
 ########################################################################
+@pytest.mark.usefixtures('streamer_root')
 class TestCelery(unittest.IsolatedAsyncioTestCase):
     """Prueba unitaria para Celery con worker."""
 
@@ -17,18 +17,25 @@ Dependencies:
 Classes:
 - TestCertificateAuthority: Unit tests for CertificateAuthority.
 
+Every test writes its certificates in the directory of the `certificates_folder`
+fixture.
+
 Methods:
-- setUpClass: Sets up the class by creating a directory for SSL certificates.
 - ca: Property that returns an instance of CertificateAuthority for testing.
 - test_ca: Tests the creation of CA certificate and private key.
 - test_csr: Tests the generation of private keys and CSRs.
 - test_sign: Tests signing of client and server CSRs by the CA.
+- test_load_signed_certificates: Tests the reuse of certificates signed by the current CA.
+- test_get_context: Tests that SSL contexts are not shared between calls.
 """
 
 import os
+import ssl
 import unittest
 import ipaddress
 
+import pytest
+
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import padding
@@ -39,30 +46,10 @@ from chaski.utils.certificate_authority import CertificateAuthority
 
 
 ########################################################################
+@pytest.mark.usefixtures('certificates_folder')
 class TestCertificateAuthority(unittest.IsolatedAsyncioTestCase):
     """"""
 
-    ssl_certificates_location = 'ssl_certificates_location'
-
-    @classmethod
-    # ----------------------------------------------------------------------
-    def setUpClass(cls) -> None:
-        """Set up the class for the Certificate Authority tests.
-
-        This method is a class-level setup method that prepares the
-        environment for testing the Certificate Authority (CA). It
-        creates a directory for storing SSL certificates if it does
-        not already exist.
-
-        Attributes
-        ----------
-        cls.ssl_certificates_location : str
-            The location where SSL certificates are stored.
-        """
-        cls.ssl_certificates_location = 'ssl_certificates_location'
-        if not os.path.exists(cls.ssl_certificates_location):
-            os.mkdir(cls.ssl_certificates_location)
-
     # ----------------------------------------------------------------------
     @property
     def ca(self) -> CertificateAuthority:
@@ -81,7 +68,7 @@ class TestCertificateAuthority(unittest.IsolatedAsyncioTestCase):
         ca = CertificateAuthority(
             'Test-ID',
             ipaddress.IPv4Address('192.168.0.1'),
-            ssl_certificates_location=self.ssl_certificates_location,
+            ssl_certificates_location=self.certificates_folder,
             ssl_certificate_attributes={
                 'Country Name': "CO",
                 'Locality Name': "Manizales",
@@ -239,29 +226,33 @@ class TestCertificateAuthority(unittest.IsolatedAsyncioTestCase):
             If there is an issue loading the CA certificates or keys.
             If the client or server certificate was not signed by the CA properly.
         """
+        # Create the CA and the CSRs to sign, the test does not depend on others
+        self.ca.setup_certificate_authority()
+        self.ca.generate_key_and_csr()
+
         ca = self.ca
 
         ca.load_ca(
             ca_key_path=os.path.join(
-                self.ssl_certificates_location, 'ca.key'
+                self.certificates_folder, 'ca.key'
             ),
             ca_cert_path=os.path.join(
-                self.ssl_certificates_location, 'ca.cert'
+                self.certificates_folder, 'ca.cert'
             ),
         )
 
         ca.load_key_and_csr(
             private_key_client_path=os.path.join(
-                self.ssl_certificates_location, 'client_Test-ID.key'
+                self.certificates_folder, 'client_Test-ID.key'
             ),
             certificate_client_path=os.path.join(
-                self.ssl_certificates_location, 'client_Test-ID.csr'
+                self.certificates_folder, 'client_Test-ID.csr'
             ),
             private_key_server_path=os.path.join(
-                self.ssl_certificates_location, 'server_Test-ID.key'
+                self.certificates_folder, 'server_Test-ID.key'
             ),
             certificate_server_path=os.path.join(
-                self.ssl_certificates_location, 'server_Test-ID.csr'
+                self.certificates_folder, 'server_Test-ID.csr'
             ),
         )
 
@@ -324,3 +315,68 @@ class TestCertificateAuthority(unittest.IsolatedAsyncioTestCase):
                 False,
                 f"The server certificate was NOT signed by the CA: {str(e)}",
             )
+
+    # ----------------------------------------------------------------------
+    def test_load_signed_certificates(self) -> None:
+        """Test the reuse of stored certificates signed by the current CA.
+
+        Recently signed certificates are loaded, but once the CA certificate in
+        the location is replaced by the one of another CA they are not reused.
+
+        Raises
+        ------
+        AssertionError
+            If recent certificates are not reused, or certificates issued by a
+            previous CA are.
+        """
+        ca = self.ca
+        ca.setup_certificate_authority()
+        self.assertFalse(ca.load_signed_certificates(max_age=60))
+
+        ca.generate_key_and_csr()
+        for name in ('client', 'server'):
+            ca.write_certificate(
+                ca.certificate_signed_paths[name],
+                ca.sign_csr(ca.load_certificate(ca.certificate_paths[name])),
+            )
+
+        cached = self.ca
+        self.assertTrue(cached.load_signed_certificates(max_age=60))
+        self.assertEqual(cached.certificate_signed_paths, ca.certificate_signed_paths)
+        self.assertFalse(cached.load_signed_certificates(max_age=-1))
+
+        # Another CA overwrites the shared CA certificate
+        self.ca.setup_certificate_authority()
+        self.assertFalse(self.ca.load_signed_certificates(max_age=60))
+
+    # ----------------------------------------------------------------------
+    def test_get_context(self) -> None:
+        """Test that every call creates new SSL contexts.
+
+        Nodes own their contexts, changing the options of one context must not
+        affect the contexts returned to other nodes.
+
+        Raises
+        ------
+        AssertionError
+            If a context is shared between calls or does not require certificates.
+        """
+        ca = self.ca
+        ca.setup_certificate_authority()
+        ca.generate_key_and_csr()
+        for name in ('client', 'server'):
+            ca.write_certificate(
+                ca.certificate_signed_paths[name],
+                ca.sign_csr(ca.load_certificate(ca.certificate_paths[name])),
+            )
+
+        client, server = ca.get_context()
+        other_client, other_server = ca.get_context()
+
+        self.assertIsNot(client, other_client)
+        self.assertIsNot(server, other_server)
+        for context in (client, server, other_client, other_server):
+            self.assertEqual(context.verify_mode, ssl.CERT_REQUIRED)
+
+        client.check_hostname = False
+        self.assertTrue(other_client.check_hostname)
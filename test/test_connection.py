@@ -21,11 +21,15 @@ Test_Connections_for_IPv4:
 Test_Connections_for_IPv6:
     Derived class that extends TestConnections for testing IPv6 connections
     specifically.
+
+TestStoppedNodes:
+    Tests that stopped nodes release their connections instead of reading or
+    reconnecting forever.
 """
 
 import unittest
 import asyncio
-from chaski.utils.auto import create_nodes
+from chaski.utils.auto import create_nodes, stop_nodes
 from typing import Optional
 
 
@@ -45,16 +49,38 @@ class TestConnections:
         """
         Close all ChaskiNode instances in the provided list.
 
-        This method iterates through each ChaskiNode instance in the given list and
-        stops their operation by invoking the `stop` method on each node.
+        The nodes are stopped concurrently by `stop_nodes`, which waits for all of
+        them and then raises the first error of a failing `stop`.
 
         Parameters
         ----------
         nodes : list of ChaskiNode
             A list containing instances of ChaskiNode that need to be stopped.
         """
-        for node in nodes:
-            await node.stop()
+        await stop_nodes(nodes)
+
+    # ----------------------------------------------------------------------
+    async def _connect_nodes(self, *pairs: tuple['ChaskiNode', 'ChaskiNode']):
+        """
+        Connect pairs of ChaskiNodes concurrently.
+
+        Every connection is opened at the same time and the method returns once
+        both ends of each of them have registered the edge, instead of waiting a
+        fixed delay for the handshakes to complete.
+
+        Parameters
+        ----------
+        *pairs : tuple of ChaskiNode
+            Pairs of nodes, the first node of each pair connects to the second one.
+        """
+        await asyncio.gather(*(node._connect_to_peer(peer) for node, peer in pairs))
+        await asyncio.gather(
+            *(
+                wait
+                for node, peer in pairs
+                for wait in (node.wait_connected(peer), peer.wait_connected(node))
+            )
+        )
 
     # ----------------------------------------------------------------------
     def assertConnection(
@@ -106,9 +132,7 @@ class TestConnections:
             If any node fails to establish the expected number of connections.
         """
         nodes = await create_nodes(4, self.ip)
-        await nodes[0]._connect_to_peer(nodes[1])
-        await nodes[2]._connect_to_peer(nodes[3])
-        await asyncio.sleep(3)
+        await self._connect_nodes((nodes[0], nodes[1]), (nodes[2], nodes[3]))
 
         for i in range(4):
             self.assertEqual(len(nodes[i].edges), 1, f"Node {i} connection failed")
@@ -137,9 +161,7 @@ class TestConnections:
             If any node fails to establish the expected number of connections.
         """
         nodes = await create_nodes(5, self.ip)
-        for i in range(1, 5):
-            await nodes[i]._connect_to_peer(nodes[0])
-        await asyncio.sleep(0.3)
+        await self._connect_nodes(*((nodes[i], nodes[0]) for i in range(1, 5)))
 
         for i in range(1, 5):
             self.assertEqual(
@@ -174,9 +196,7 @@ class TestConnections:
             state after disconnection.
         """
         nodes = await create_nodes(5, self.ip)
-        for i in range(1, 5):
-            await nodes[i]._connect_to_peer(nodes[0])
-        await asyncio.sleep(0.3)
+        await self._connect_nodes(*((nodes[i], nodes[0]) for i in range(1, 5)))
 
         await nodes[0].stop()
         await asyncio.sleep(0.3)
@@ -212,14 +232,10 @@ class TestConnections:
         """
         nodes = await create_nodes(6, self.ip)
 
-        for i in range(1, 5):
-            await nodes[i]._connect_to_peer(nodes[0])
-        await asyncio.sleep(0.3)
+        await self._connect_nodes(*((nodes[i], nodes[0]) for i in range(1, 5)))
 
-        for i in range(1, 5):
-            await nodes[i]._connect_to_peer(nodes[5])
+        await self._connect_nodes(*((nodes[i], nodes[5]) for i in range(1, 5)))
 
-        await asyncio.sleep(0.3)
         for i in range(4):
             await nodes[0].close_connection(nodes[0].edges[0])
             await asyncio.sleep(0.3)
@@ -256,9 +272,7 @@ class TestConnections:
             If the connection management does not reflect expected states after disconnections.
         """
         nodes = await create_nodes(5, self.ip)
-        for i in range(1, 5):
-            await nodes[i]._connect_to_peer(nodes[0])
-        await asyncio.sleep(0.3)
+        await self._connect_nodes(*((nodes[i], nodes[0]) for i in range(1, 5)))
 
         self.assertEqual(len(nodes[0].edges), 4, "Node 0 connections failed")
         for i in range(1, 5):
@@ -303,9 +317,7 @@ class TestConnections:
             If connection management does not reflect expected states after disconnections.
         """
         nodes = await create_nodes(5, self.ip)
-        for i in range(1, 5):
-            await nodes[i]._connect_to_peer(nodes[0])
-        await asyncio.sleep(0.5)
+        await self._connect_nodes(*((nodes[i], nodes[0]) for i in range(1, 5)))
 
         self.assertEqual(len(nodes[0].edges), 4, "Node 0 connections failed")
         for i in range(1, 5):
@@ -348,8 +360,7 @@ class TestConnections:
             If the response data does not match the sent data.
         """
         nodes = await create_nodes(2, self.ip)
-        await nodes[1]._connect_to_peer(nodes[0])
-        await asyncio.sleep(0.5)
+        await self._connect_nodes((nodes[1], nodes[0]))
 
         dummy_data = {
             nodes[0].uuid(): nodes[0].uuid(),
@@ -514,5 +525,82 @@ class Test_Connections_for_IPv6(unittest.IsolatedAsyncioTestCase, TestConnection
         return await super().test_response_udp()
 
 
+########################################################################
+class TestStoppedNodes(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the connections of ChaskiNode instances once they are stopped.
+    """
+
+    ip = '127.0.0.1'
+
+    # ----------------------------------------------------------------------
+    async def test_reader_loops_end(self):
+        """
+        Test that the reader loops of stopped nodes end with their streams.
+
+        Each end of a connection reads it in its own reader loop task. Once
+        both nodes are stopped the streams are at end of file, and the loops
+        must return instead of polling them until the event loop is closed.
+        """
+        nodes = await create_nodes(2, self.ip)
+        await nodes[1]._connect_to_peer(nodes[0])
+        await asyncio.gather(
+            nodes[1].wait_connected(nodes[0]), nodes[0].wait_connected(nodes[1])
+        )
+
+        reader_loops = [
+            task
+            for task in asyncio.all_tasks()
+            if task.get_coro().__qualname__ == 'ChaskiNode._reader_loop'
+        ]
+        self.assertEqual(len(reader_loops), 2)
+
+        await asyncio.gather(*(node.stop() for node in nodes))
+        done, pending = await asyncio.wait(reader_loops, timeout=2)
+        self.assertFalse(pending, "The reader loops should end once the nodes stop.")
+
+    # ----------------------------------------------------------------------
+    async def test_no_reconnection_after_stop(self):
+        """
+        Test that a stopped node does not try to reconnect with its lost edges.
+
+        A reconnection attempt waits 5 seconds before connecting, a stopped
+        node must return at once and leave `reconnecting` cleared.
+        """
+        nodes = await create_nodes(2, self.ip)
+        await nodes[1]._connect_to_peer(nodes[0])
+        await nodes[1].wait_connected(nodes[0])
+        edge = nodes[1].edges[0]
+
+        await asyncio.gather(*(node.stop() for node in nodes))
+        # The nodes of `create_nodes` never reconnect, enable it for this one
+        nodes[1].reconnections = 3
+        await asyncio.wait_for(nodes[1].try_to_reconnect(edge), timeout=1)
+
+        self.assertFalse(nodes[1].reconnecting.is_set())
+        self.assertFalse(nodes[1].edges)
+
+    # ----------------------------------------------------------------------
+    async def test_stop_nodes_raises_after_all_stop(self):
+        """
+        Test that `stop_nodes` stops every node before raising a stop error.
+
+        The first node fails to stop, the second one must still be stopped
+        and the error of the first one must reach the caller.
+        """
+        nodes = await create_nodes(2, self.ip)
+        stop = nodes[0].stop
+
+        async def failing_stop():
+            await stop()
+            raise RuntimeError('stop failed')
+
+        nodes[0].stop = failing_stop
+
+        with self.assertRaisesRegex(RuntimeError, 'stop failed'):
+            await stop_nodes(nodes)
+        self.assertFalse(nodes[1].server.is_serving())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,9 +16,14 @@ Classes
 
 import unittest
 import asyncio
-from chaski.utils.auto import create_nodes
+from chaski.utils.auto import create_nodes, stop_nodes
 from typing import Optional
 
+# Subscription layouts shared across the discovery tests
+_SUBS_AB = ('A', 'B')
+_SUBS_ABB = ('A', 'B', 'B')
+_SUBS_ABBBBBB = tuple('A' + 'B' * 6)
+
 
 ########################################################################
 class TestDiscovery(unittest.IsolatedAsyncioTestCase):
@@ -31,21 +36,64 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
 
     ip = '127.0.0.1'
 
+    # ----------------------------------------------------------------------
+    async def asyncSetUp(self) -> None:
+        """
+        Disable asyncio debug mode on the event loop created for each test.
+
+        `IsolatedAsyncioTestCase` runs every test on a new loop with debug mode
+        enabled, which adds slow callback tracking and coroutine origin bookkeeping
+        to each iteration of the loop.
+        """
+        asyncio.get_running_loop().set_debug(False)
+
     # ----------------------------------------------------------------------
     async def _close_nodes(self, nodes: list['ChaskiNode']):
         """
         Close all ChaskiNode instances in the provided list.
 
-        This method iterates through each ChaskiNode instance in the given list and
-        stops their operation by invoking the `stop` method on each node.
+        The nodes are stopped concurrently by `stop_nodes`, which waits for all of
+        them and then raises the first error of a failing `stop`. Tests register
+        it with `addAsyncCleanup` as soon as the nodes are created, so the nodes
+        are stopped even when an assertion fails.
 
         Parameters
         ----------
         nodes : list of ChaskiNode
             A list containing instances of ChaskiNode that need to be stopped.
         """
-        for node in nodes:
-            await node.stop()
+        await stop_nodes(nodes)
+
+    # ----------------------------------------------------------------------
+    async def _await_edges(
+        self, nodes: list['ChaskiNode'], expected: list[int], total: float = 1.0
+    ):
+        """
+        Wait until every node has the expected number of edges.
+
+        The edge counts are probed after exponentially increasing delays, 5 ms,
+        10 ms, 20 ms and so on, so a settled network is detected within a few
+        milliseconds while slow handshakes are still tolerated. Nothing is raised
+        after `total` seconds, the assertions that follow report the counts.
+
+        Parameters
+        ----------
+        nodes : list of ChaskiNode
+            The nodes of the test.
+        expected : list of int
+            The expected number of edges of each node.
+        total : float, optional
+            Maximum time in seconds to wait.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + total
+        delay = 0.005
+        while [len(node.edges) for node in nodes] != expected:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(delay, remaining))
+            delay *= 2
 
     # ----------------------------------------------------------------------
     def assertConnection(
@@ -99,18 +147,17 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If the nodes do not correctly establish the connection without discovery.
         """
-        nodes = await create_nodes(list('AB'), self.ip)
+        nodes = await create_nodes(_SUBS_AB, self.ip)
+        self.addAsyncCleanup(self._close_nodes, nodes)
         await nodes[0].connect(nodes[1])
 
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [1, 1])
         await nodes[1].discovery()
 
         for i, node in enumerate(nodes):
             self.assertEqual(len(node.edges), 1, f"Node {i} discovery failed")
         self.assertConnection(*nodes, "The nodes are not connected to each other")
 
-        await self._close_nodes(nodes)
-
     # ----------------------------------------------------------------------
     async def test_single_server_connect_discovery(self):
         """
@@ -135,11 +182,12 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If any node fails to establish the expected number of connections.
         """
-        nodes = await create_nodes(list('ABB'), self.ip)
+        nodes = await create_nodes(_SUBS_ABB, self.ip)
+        self.addAsyncCleanup(self._close_nodes, nodes)
         await nodes[0].connect(nodes[1])
         await nodes[0].connect(nodes[2])
 
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [2, 1, 1])
         self.assertEqual(len(nodes[0].edges), 2, f"Node 0 discovery failed")
         self.assertEqual(len(nodes[1].edges), 1, f"Node 1 discovery failed")
         self.assertEqual(len(nodes[2].edges), 1, f"Node 2 discovery failed")
@@ -147,7 +195,7 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         nodes[1].paired_event['B'].set()
         await nodes[2].discovery(on_pair='none', timeout=10)
 
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [2, 2, 2])
         self.assertEqual(
             len(nodes[0].edges), 2, f"Node 0 discovery failed after discovery"
         )
@@ -168,8 +216,6 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
             nodes[1], nodes[2], "The node 1 is not connected to node 2"
         )
 
-        await self._close_nodes(nodes)
-
     # ----------------------------------------------------------------------
     async def test_single_discovery(self):
         """
@@ -193,11 +239,12 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If any node fails to establish the expected number of connections.
         """
-        nodes = await create_nodes(list('ABB'), self.ip)
+        nodes = await create_nodes(_SUBS_ABB, self.ip)
+        self.addAsyncCleanup(self._close_nodes, nodes)
         await nodes[1].connect(nodes[0])
         await nodes[2].connect(nodes[0])
 
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [2, 1, 1])
         self.assertEqual(len(nodes[0].edges), 2, f"Node 0 discovery failed")
         self.assertEqual(len(nodes[1].edges), 1, f"Node 1 discovery failed")
         self.assertEqual(len(nodes[2].edges), 1, f"Node 2 discovery failed")
@@ -205,7 +252,7 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         await nodes[1].discovery(on_pair='none', timeout=10)
         await nodes[2].discovery(on_pair='none', timeout=10)
 
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [2, 2, 2])
         self.assertEqual(
             len(nodes[0].edges), 2, f"Node 0 discovery failed after discovery"
         )
@@ -226,8 +273,6 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
             nodes[1], nodes[2], "The node 1 is not connected to node 2"
         )
 
-        await self._close_nodes(nodes)
-
     # ----------------------------------------------------------------------
     async def test_single_discovery_with_disconnection(self):
         """
@@ -250,18 +295,19 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If any node fails to establish or maintain the expected connections after discovery and disconnections.
         """
-        nodes = await create_nodes(list('ABB'), self.ip)
+        nodes = await create_nodes(_SUBS_ABB, self.ip)
+        self.addAsyncCleanup(self._close_nodes, nodes)
         await nodes[1].connect(nodes[0])
         await nodes[2].connect(nodes[0])
 
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [2, 1, 1])
         self.assertEqual(len(nodes[0].edges), 2, f"Node 0 connection failed")
         self.assertEqual(len(nodes[1].edges), 1, f"Node 1 connection failed")
         self.assertEqual(len(nodes[2].edges), 1, f"Node 2 connection failed")
 
         nodes[1].paired_event['B'].set()
         await nodes[2].discovery(on_pair='disconnect', timeout=10)
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [1, 2, 1])
 
         self.assertEqual(
             len(nodes[0].edges), 1, f"Node 0 discovery failed after discovery"
@@ -280,8 +326,6 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
             nodes[2], nodes[1], "The node 0 is not connected to node 2"
         )
 
-        await self._close_nodes(nodes)
-
     # ----------------------------------------------------------------------
     async def test_multiple_discovery(self):
         """
@@ -305,7 +349,8 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If any node fails to establish the expected number of connections after discovery.
         """
-        nodes = await create_nodes(list('ABBBBBB'), self.ip)
+        nodes = await create_nodes(_SUBS_ABBBBBB, self.ip)
+        self.addAsyncCleanup(self._close_nodes, nodes)
         await nodes[1]._connect_to_peer(nodes[0])
         await nodes[2]._connect_to_peer(nodes[0])
         await nodes[3]._connect_to_peer(nodes[0])
@@ -313,7 +358,7 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         await nodes[5]._connect_to_peer(nodes[0])
         await nodes[6]._connect_to_peer(nodes[0])
 
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [6, 1, 1, 1, 1, 1, 1])
         self.assertEqual(len(nodes[0].edges), 6, f"Node 0 discovery failed")
         self.assertEqual(len(nodes[1].edges), 1, f"Node 1 discovery failed")
         self.assertEqual(len(nodes[2].edges), 1, f"Node 2 discovery failed")
@@ -322,14 +367,10 @@ class TestDiscovery(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(nodes[5].edges), 1, f"Node 5 discovery failed")
         self.assertEqual(len(nodes[6].edges), 1, f"Node 6 discovery failed")
 
-        await nodes[1].discovery(on_pair='none', timeout=10)
-        await nodes[2].discovery(on_pair='none', timeout=10)
-        await nodes[3].discovery(on_pair='none', timeout=10)
-        await nodes[4].discovery(on_pair='none', timeout=10)
-        await nodes[5].discovery(on_pair='none', timeout=10)
-        await nodes[6].discovery(on_pair='none', timeout=10)
+        for node in nodes[1:]:
+            await node.discovery(on_pair='none', timeout=10)
 
-        await asyncio.sleep(0.3)
+        await self._await_edges(nodes, [6, 5, 3, 2, 2, 2, 2])
         self.assertEqual(
             len(nodes[0].edges), 6, f"Node 0 discovery failed after discovery"
         )
@@ -10,17 +10,29 @@ Classes
 -------
 TestRemote : unittest.IsolatedAsyncioTestCase
     A test case for testing the `ChaskiRemote` class functionality.
+
+Notes
+-----
+Every node binds to a kernel-assigned port (`port=0`), so these tests can
+run concurrently under `pytest -n auto` without port conflicts.
 """
 
 import unittest
 import os
 import asyncio
+import pytest
+from typing import Tuple
+from types import SimpleNamespace
 from chaski.remote import ChaskiRemote
+from chaski.utils.auto import stop_nodes
 import numpy as np
 
 import logging
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# ChaskiRemote relies on nest_asyncio, which only patches the default event loop
+pytestmark = pytest.mark.no_uvloop
 
 
 ########################################################################
@@ -33,6 +45,40 @@ class TestRemote(unittest.IsolatedAsyncioTestCase):
     ChaskiRemote class behaves as expected.
     """
 
+    # ----------------------------------------------------------------------
+    async def asyncSetUp(self) -> None:
+        """
+        Create a connected server and client pair shared by the test methods.
+
+        The server exposes the 'os' and 'numpy' modules, tests that need a
+        different configuration create their own nodes and register them in
+        `self.nodes` so they are stopped on teardown.
+        """
+        self.nodes = []
+
+        self.server = ChaskiRemote(
+            port=0,
+            available=['os', 'numpy'],
+            reconnections=None,
+        )
+        await asyncio.wait_for(self.server.serving_event.wait(), timeout=5)
+
+        self.client = ChaskiRemote(
+            port=0,
+            reconnections=None,
+        )
+        await self.client.connect(self.server.address)
+        await asyncio.wait_for(self.client.connected_event.wait(), timeout=2)
+
+        self.nodes.append(self.server)
+        self.nodes.append(self.client)
+
+    # ----------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        """Stop every node created by the test and raise the first stop error."""
+        logger.debug("Closing nodes %s", [node.port for node in self.nodes])
+        await stop_nodes(self.nodes)
+
     # ----------------------------------------------------------------------
     async def test_module_no_available_register(self):
         """
@@ -54,30 +100,26 @@ class TestRemote(unittest.IsolatedAsyncioTestCase):
             if the connection steps fail.
         """
         server = ChaskiRemote(
-            port=65440,
+            port=0,
             available=[],
             reconnections=None,
         )
-        await asyncio.sleep(0.3)
+        self.nodes.append(server)
+        await asyncio.wait_for(server.serving_event.wait(), timeout=5)
 
         client = ChaskiRemote(
-            port=65441,
+            port=0,
             reconnections=None,
         )
+        self.nodes.append(client)
         await client.connect(server.address)
-        await asyncio.sleep(0.3)
+        await asyncio.wait_for(client.connected_event.wait(), timeout=2)
 
+        # The server refuses the module, so no proxy is returned
         os_remote = client.proxy('os')
-        await asyncio.sleep(0.3)
 
-        try:
+        with self.assertRaises(AttributeError):
             os_remote.name
-            self.fail('bad, the module has access')
-        except:
-            self.assertTrue(True, 'ok, the module has not access')
-
-        await server.stop()
-        await client.stop()
 
     # ----------------------------------------------------------------------
     async def test_module_register(self):
@@ -85,8 +127,8 @@ class TestRemote(unittest.IsolatedAsyncioTestCase):
         Test the registration and remote access of a specified module.
 
         This test method performs the following steps:
-        1. Sets up a ChaskiRemote server with the 'os' module available for proxying.
-        2. Connects a client to the server.
+        1. Uses the shared ChaskiRemote server, with the 'os' module available for proxying.
+        2. Uses the client connected to the server.
         3. Proxies the 'os' module on the client.
         4. Verifies that the 'os' module's 'listdir' method works correctly when called remotely.
         5. Confirms that the name attribute of the 'os' module matches between the client and server.
@@ -97,79 +139,150 @@ class TestRemote(unittest.IsolatedAsyncioTestCase):
             If the proxied 'os' module's method call results do not match the expected values, or
             if any exceptions are encountered during the test steps.
         """
-        server = ChaskiRemote(
-            port=65434,
-            available=['os'],
-            reconnections=None,
-        )
-        await asyncio.sleep(0.3)
-
-        client = ChaskiRemote(
-            port=65435,
-            reconnections=None,
-        )
-        await client.connect(server.address)
-        await asyncio.sleep(0.3)
-
-        os_remote = client.proxy('os')
-        await asyncio.sleep(0.3)
+        os_remote = self.client.proxy('os')
 
         self.assertIsInstance(os_remote.listdir('.'), list)
         self.assertEqual(str(os_remote.name), os.name)
 
-        await server.stop()
-        await client.stop()
-
     # ----------------------------------------------------------------------
     async def test_secuential_calls(self):
         """"""
-        server = ChaskiRemote(
-            port=65434,
-            available=['os'],
-            reconnections=None,
-        )
-        await asyncio.sleep(0.3)
-
-        client = ChaskiRemote(
-            port=65435,
-            reconnections=None,
-        )
-        await client.connect(server.address)
-        await asyncio.sleep(0.3)
-
-        os_remote = client.proxy('os')
-        await asyncio.sleep(0.3)
+        os_remote = self.client.proxy('os')
 
         for _ in range(10):
             self.assertIsInstance(os_remote.listdir('.'), list)
             self.assertEqual(str(os_remote.name), os.name)
             self.assertEqual(os_remote.name._, os.name)
 
-        await server.stop()
-        await client.stop()
+    # ----------------------------------------------------------------------
+    async def test_batch_calls(self):
+        """
+        Test that a batch of calls returns one result per call, in order.
+        """
+        calls = [('os.listdir', ('.',), {}), ('os.name', None, None)] * 10
+        results = self.client.proxy_batch(calls)
+
+        self.assertEqual(len(results), len(calls))
+        for listdir, name in zip(results[::2], results[1::2]):
+            self.assertIsInstance(listdir, list)
+            self.assertEqual(name, os.name)
 
     # ----------------------------------------------------------------------
-    async def test_numpy_calls(self):
-        """"""
+    async def cached_counter(
+        self, **server_kwargs
+    ) -> Tuple[ChaskiRemote, ChaskiRemote, list]:
+        """
+        Create a server exposing a counting function and a client connected to it.
+
+        The server exposes 'os' and a 'counter' module whose `count` function
+        records every value it is called with, and marks 'os.listdir' and
+        'counter.count' as cacheable.
+
+        Parameters
+        ----------
+        **server_kwargs
+            Extra keyword arguments for the server, such as `cache_ttl`.
+
+        Returns
+        -------
+        Tuple[ChaskiRemote, ChaskiRemote, list]
+            The server, the client and the list of values `count` was called with.
+        """
+        calls = []
+
+        def count(value=None):
+            calls.append(value)
+            return value
+
         server = ChaskiRemote(
-            port=65434,
-            available=['numpy'],
+            port=0,
+            cacheable=['os.listdir', 'counter.count'],
             reconnections=None,
+            **server_kwargs,
         )
-        await asyncio.sleep(0.3)
+        self.nodes.append(server)
+        server.register_module('os', os)
+        server.register_module('counter', SimpleNamespace(count=count))
+        await asyncio.wait_for(server.serving_event.wait(), timeout=5)
 
         client = ChaskiRemote(
-            port=65435,
+            port=0,
             reconnections=None,
         )
+        self.nodes.append(client)
         await client.connect(server.address)
-        await asyncio.sleep(0.3)
+        await asyncio.wait_for(client.connected_event.wait(), timeout=2)
 
-        np_remote = client.proxy('numpy')
-        await asyncio.sleep(0.3)
+        return server, client, calls
+
+    # ----------------------------------------------------------------------
+    async def test_cacheable_calls(self):
+        """
+        Test that repeated calls to a cacheable function reuse a single result.
+
+        Ten identical calls through the proxy must run the function once, and a
+        batch of cacheable and non cacheable calls must only store the former.
+        """
+        server, client, calls = await self.cached_counter(cache_ttl=5)
+
+        counter_remote = client.proxy('counter')
+        for _ in range(10):
+            self.assertEqual(counter_remote.count(7), 7)
+        self.assertEqual(
+            calls.count(7), 1, "The cached result should be reused for every call."
+        )
+
+        server.proxy_cache.clear()
+        batch = [('os.listdir', ('.',), {}), ('os.name', None, None)] * 10
+        results = client.proxy_batch(batch)
+
+        self.assertEqual(results[0], os.listdir('.'))
+        self.assertEqual(len(server.proxy_cache), 1)
+
+    # ----------------------------------------------------------------------
+    async def test_cache_ttl(self):
+        """
+        Test that a cached result is computed again once `cache_ttl` has passed.
+        """
+        server, client, calls = await self.cached_counter(cache_ttl=0.05)
+
+        client.proxy_batch([('counter.count', (7,), {})] * 5)
+        self.assertEqual(calls, [7])
+
+        await asyncio.sleep(0.1)
+        client.proxy_batch([('counter.count', (7,), {})] * 5)
+        self.assertEqual(calls, [7, 7], "An expired result should not be reused.")
+
+    # ----------------------------------------------------------------------
+    async def test_cache_maxsize(self):
+        """
+        Test that the oldest cached results are evicted beyond `cache_maxsize`.
+        """
+        server, client, calls = await self.cached_counter(
+            cache_ttl=5, cache_maxsize=2
+        )
+
+        client.proxy_batch([('counter.count', (value,), {}) for value in (1, 2, 3)])
+        self.assertEqual(len(server.proxy_cache), 2)
+
+        # 3 and 2 are still cached, 1 was evicted and runs again
+        client.proxy_batch([('counter.count', (value,), {}) for value in (3, 2, 1)])
+        self.assertEqual(calls, [1, 2, 3, 1])
+        self.assertEqual(len(server.proxy_cache), 2)
+
+    # ----------------------------------------------------------------------
+    async def test_numpy_calls(self):
+        """"""
+        np_remote = self.client.proxy('numpy')
 
         self.assertIsInstance(np_remote.pi._, float)
         self.assertEqual(np_remote.random.normal(0, 1, size=(2, 2)).shape, (2, 2))
+
+        array = np_remote.random.normal(0, 1, size=(3, 4))
+        self.assertIsInstance(array, np.ndarray)
+        self.assertEqual(array.dtype, np.float64)
+        array[0, 0] = 0  # arrays rebuilt from the raw buffer must stay writable
+
         self.assertEqual(np_remote.random.normal(0, 1, size=(4, 4)).shape, (4, 4))
         self.assertAlmostEqual(np_remote.pi._, 3.141592653589793)
 
@@ -177,8 +290,47 @@ class TestRemote(unittest.IsolatedAsyncioTestCase):
         seed = state[1][0]
         self.assertIsInstance(seed, np.uint32)
 
-        await server.stop()
-        await client.stop()
+    # ----------------------------------------------------------------------
+    async def test_numpy_structured_and_masked_calls(self):
+        """
+        Test that structured and masked arrays keep their fields and mask.
+
+        Only plain arrays travel as raw buffers, these ones are serialized.
+        The factories are registered on a dedicated server, which exposes
+        every registered module because it has no `available` list.
+        """
+        server = ChaskiRemote(port=0, reconnections=None)
+        self.nodes.append(server)
+        server.register_module(
+            'arrays',
+            SimpleNamespace(
+                structured=lambda size=3: np.zeros(
+                    size, dtype=[('x', '<i4'), ('y', '<f8')]
+                ),
+                masked=lambda: np.ma.masked_array(
+                    [1, 2, 3], mask=[False, True, False]
+                ),
+            ),
+        )
+        await asyncio.wait_for(server.serving_event.wait(), timeout=5)
+
+        client = ChaskiRemote(port=0, reconnections=None)
+        self.nodes.append(client)
+        await client.connect(server.address)
+        await asyncio.wait_for(client.connected_event.wait(), timeout=2)
+
+        arrays_remote = client.proxy('arrays')
+
+        structured = arrays_remote.structured(4)
+        self.assertIs(type(structured), np.ndarray)
+        self.assertEqual(structured.shape, (4,))
+        self.assertEqual(structured.dtype.names, ('x', 'y'))
+        self.assertEqual(structured['y'].dtype, np.float64)
+
+        masked = arrays_remote.masked()
+        self.assertIsInstance(masked, np.ma.MaskedArray)
+        self.assertEqual(masked.mask.tolist(), [False, True, False])
+        self.assertEqual(masked.sum(), 4)
 
 
 if __name__ == '__main__':
@@ -10,8 +10,10 @@ streaming of messages between producers and consumers within a distributed syste
 """
 
 import unittest
+import pytest
 import asyncio
 import os
+from typing import List, Optional, Tuple
 from chaski.streamer import ChaskiStreamer
 from chaski.utils.auto import run_transmission
 
@@ -26,7 +28,69 @@ class TestStreamer(unittest.IsolatedAsyncioTestCase):
     to ensure that messages are correctly streamed and received.
     """
 
+    # Transport of the streamers, replaced by the `chaski_transport` fixture under pytest
+    transport = 'tcp'
+
+    # ----------------------------------------------------------------------
+    async def streamer_pair(
+        self,
+        topic: str,
+        producer_kwargs: Optional[dict] = None,
+        consumer_kwargs: Optional[dict] = None,
+        connect: bool = True,
+    ) -> Tuple[ChaskiStreamer, ChaskiStreamer]:
+        """
+        Create a producer and a consumer subscribed to the same topic.
+
+        Both streamers listen on free ports and are drained and stopped as an
+        async cleanup, so the test body only deals with the transfer itself.
+
+        Parameters
+        ----------
+        topic : str
+            The topic both streamers subscribe to.
+        producer_kwargs : Optional[dict]
+            Extra keyword arguments for the producer.
+        consumer_kwargs : Optional[dict]
+            Extra keyword arguments for the consumer.
+        connect : bool
+            If True, connect the producer to the consumer and wait for the handshake.
+
+        Returns
+        -------
+        Tuple[ChaskiStreamer, ChaskiStreamer]
+            The producer and the consumer.
+        """
+        producer = ChaskiStreamer(
+            name='Producer',
+            subscriptions=[topic],
+            reconnections=None,
+            transport=self.transport,
+            **(producer_kwargs or {}),
+        )
+        consumer = ChaskiStreamer(
+            name='Consumer',
+            subscriptions=[topic],
+            reconnections=None,
+            transport=self.transport,
+            **(consumer_kwargs or {}),
+        )
+
+        async def close() -> None:
+            await asyncio.gather(producer.drain(), consumer.drain())
+            await asyncio.gather(consumer.stop(), producer.stop())
+
+        self.addAsyncCleanup(close)
+
+        if connect:
+            await consumer.serving_event.wait()
+            await producer.connect(consumer.address)
+            await producer.wait_connected(consumer)
+
+        return producer, consumer
+
     # ----------------------------------------------------------------------
+    @pytest.mark.tcp
     async def test_stream(self) -> None:
         """
         Test the streaming functionality between a producer and a consumer.
@@ -43,33 +107,28 @@ class TestStreamer(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If the received data does not match the expected values.
         """
-        producer = ChaskiStreamer(
-            port=8511,
-            name='Producer',
-            subscriptions=['topic1'],
-            reconnections=None,
-        )
-
-        consumer = ChaskiStreamer(
-            port=8512,
-            name='Consumer',
-            subscriptions=['topic1'],
-            reconnections=None,
-        )
+        producer, consumer = await self.streamer_pair('topic1', connect=False)
 
         await run_transmission(producer, consumer, parent=self)
 
     # ----------------------------------------------------------------------
-    async def test_file_transfer(self) -> None:
+    async def transfer_files(self, filenames: List[str], rounds: int = 1) -> None:
         """
-        Test the file transfer functionality between a producer and a consumer.
+        Push files from a producer to a consumer and validate the received data.
 
-        This test method covers the following operations:
+        This helper covers the following operations:
         1. Initialize a producer and a consumer with the same subscription topic for file transfer.
         2. Establish a connection between the producer and consumer.
         3. Push files from the producer to the consumer and validate the received file data including size and hash.
 
-        This test ensures that files are transferred correctly between the producer and the consumer.
+        The same pair of streamers is reused for every round.
+
+        Parameters
+        ----------
+        filenames : List[str]
+            The names of the session dummy files, their sizes are the expected ones.
+        rounds : int, optional
+            The number of times the files are pushed and validated.
 
         Raises
         ------
@@ -77,81 +136,255 @@ class TestStreamer(unittest.IsolatedAsyncioTestCase):
             If the received file data (size or hash) does not match the expected values.
         """
 
+        received_files = []
+        all_files_received = asyncio.Event()
+
         def new_file_event(**kwargs):
-            size = kwargs['data']['size']
-            self.assertEqual(
-                size,
-                kwargs['size'],
-                f"File {kwargs['filename']} no match size of {kwargs['filename'][6:-5]}",
-            )
-            hash = ChaskiStreamer.get_hash(
-                os.path.join(
-                    kwargs['destination_folder'],
-                    kwargs['filename'],
+            received_files.append(kwargs)
+            if len(received_files) == len(filenames):
+                all_files_received.set()
+
+        file_transfer = {
+            'allow_incoming_files': True,
+            'file_handling_callback': new_file_event,
+            'destination_folder': self.output_folder,
+            # Every drain waits for the chunks to reach the socket
+            'write_buffer_limit': 0,
+        }
+        producer, consumer = await self.streamer_pair(
+            'topicF', producer_kwargs=file_transfer, consumer_kwargs=file_transfer
+        )
+
+        for _ in range(rounds):
+            received_files.clear()
+            all_files_received.clear()
+            # The session maps are pushed from the start, no file is opened per round
+            maps = [self.input_maps[filename] for filename in filenames]
+            for mapped in maps:
+                mapped.seek(0)
+
+            await asyncio.gather(
+                *(
+                    producer.push_file(
+                        'topicF',
+                        mapped,
+                        filename=filename,
+                        data={
+                            'size': len(mapped),
+                        },
+                        precomputed_hash=self.input_hashes[filename],
+                    )
+                    for filename, mapped in zip(filenames, maps)
                 )
             )
-            self.assertEqual(
-                hash,
-                kwargs['hash'],
-                "The hash of the received file does not match the expected hash.",
+
+            await asyncio.wait_for(all_files_received.wait(), timeout=60)
+
+            # The hashes were verified while receiving, stat all the files in one pass
+            loop = asyncio.get_running_loop()
+            sizes_on_disk = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        None,
+                        os.path.getsize,
+                        os.path.join(kwargs['destiny_folder'], kwargs['filename']),
+                    )
+                    for kwargs in received_files
+                )
             )
+            for kwargs, size_on_disk in zip(received_files, sizes_on_disk):
+                self.assertEqual(
+                    kwargs['data']['size'],
+                    kwargs['size'],
+                    f"File {kwargs['filename']} no match size of {kwargs['filename'][6:-5]}",
+                )
+                self.assertEqual(
+                    size_on_disk,
+                    kwargs['data']['size'],
+                    f"Received file {kwargs['filename']} has a different size on disk.",
+                )
+                self.assertTrue(
+                    kwargs['verified'],
+                    "The hash of the received file does not match the expected hash.",
+                )
 
-        producer = ChaskiStreamer(
-            port=8513,
-            name='Producer',
-            subscriptions=['topicF'],
-            reconnections=None,
-            #
-            # File transfer
-            allow_incoming_files=True,
-            file_handling_callback=new_file_event,
-            destination_folder=os.path.join('testdir', 'output'),
+    # ----------------------------------------------------------------------
+    @pytest.mark.usefixtures('transfer_folders')
+    async def test_file_transfer(self) -> None:
+        """
+        Test the file transfer functionality between a producer and a consumer.
+
+        Transfers files from 1KB up to 10MB concurrently and validates their size
+        and hash on the consumer side.
+        """
+        await self.transfer_files(
+            [
+                'dummy_1KB.data',
+                'dummy_10KB.data',
+                'dummy_100KB.data',
+                'dummy_1MB.data',
+                'dummy_10MB.data',
+            ]
         )
 
-        consumer = ChaskiStreamer(
-            port=8514,
-            name='Consumer',
-            subscriptions=['topicF'],
-            reconnections=None,
-            #
-            # File transfer
-            allow_incoming_files=True,
-            file_handling_callback=new_file_event,
-            destination_folder=os.path.join('testdir', 'output'),
+    # ----------------------------------------------------------------------
+    @pytest.mark.usefixtures('transfer_folders')
+    async def test_file_transfer_overwrite(self) -> None:
+        """
+        Test that receiving a file again replaces the previous copy instead of appending to it.
+        """
+        await self.transfer_files(['dummy_10KB.data'], rounds=2)
+
+    # ----------------------------------------------------------------------
+    async def push_with_algorithms(
+        self, producer_algorithm: str, consumer_algorithm: str, **push_kwargs
+    ) -> dict:
+        """
+        Push a file between streamers configured with different hash algorithms.
+
+        Parameters
+        ----------
+        producer_algorithm : str
+            The `hash_algorithm` of the producer, the one sent with the file.
+        consumer_algorithm : str
+            The `hash_algorithm` of the consumer.
+        **push_kwargs
+            Extra keyword arguments for `push_file`.
+
+        Returns
+        -------
+        dict
+            The keyword arguments passed to the file handling callback of the consumer.
+        """
+        received = asyncio.get_running_loop().create_future()
+        producer, consumer = await self.streamer_pair(
+            'topicF',
+            producer_kwargs={'hash_algorithm': producer_algorithm},
+            consumer_kwargs={
+                'hash_algorithm': consumer_algorithm,
+                'allow_incoming_files': True,
+                'file_handling_callback': lambda **kwargs: received.set_result(kwargs),
+                'destination_folder': self.output_folder,
+            },
         )
 
-        await asyncio.sleep(0.3)
-        await producer.connect(consumer.address)
-        await asyncio.sleep(0.3)
-
-        for filename, size in [
-            ('dummy_1KB.data', 1e3),
-            ('dummy_10KB.data', 10e3),
-            ('dummy_100KB.data', 100e3),
-            ('dummy_1MB.data', 1e6),
-            ('dummy_10MB.data', 10e6),
-            ('dummy_100MB.data', 100e6),
-            # ('dummy_500MB.data', 500e6),
-            # ('dummy_1000MB.data', 1000e6),
-            # ('dummy_1500MB.data', 1500e6),
-        ]:
-            if os.path.exists(os.path.join('testdir', 'output', filename)):
-                os.remove(os.path.join('testdir', 'output', filename))
-
-            with open(os.path.join('testdir', 'input', filename), 'rb') as file:
-                await producer.push_file(
-                    'topicF',
-                    file,
-                    data={
-                        'size': size,
-                    },
-                )
+        mapped = self.input_maps['dummy_10KB.data']
+        mapped.seek(0)
+        await producer.push_file(
+            'topicF', mapped, filename='dummy_10KB.data', **push_kwargs
+        )
+        kwargs = await asyncio.wait_for(received, timeout=10)
+
+        self.assertTrue(
+            consumer.edges, "The consumer should keep the edge with the producer."
+        )
+        return kwargs
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.usefixtures('transfer_folders')
+    async def test_file_transfer_mismatched_algorithms(self) -> None:
+        """
+        Test that a receiver verifies files with the algorithm chosen by the sender.
+        """
+        kwargs = await self.push_with_algorithms('sha512', 'sha256')
+
+        self.assertEqual(kwargs['hash_algorithm'], 'sha512')
+        self.assertTrue(
+            kwargs['verified'],
+            "The receiver should verify the file with the algorithm of the sender.",
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.usefixtures('transfer_folders')
+    async def test_file_transfer_unsupported_algorithm(self) -> None:
+        """
+        Test that a file hashed with an algorithm unknown to the receiver is not verified.
+
+        The producer sends a known digest, so it never hashes with the unknown
+        algorithm itself. The consumer still writes the file, reports it as not
+        verified and keeps the connection open.
+        """
+        kwargs = await self.push_with_algorithms(
+            'unknown-hash',
+            'sha256',
+            precomputed_hash=self.input_hashes['dummy_10KB.data'],
+        )
+
+        self.assertIsNone(kwargs['computed_hash'])
+        self.assertFalse(
+            kwargs['verified'],
+            "A file hashed with an unsupported algorithm can not be verified.",
+        )
+        self.assertEqual(
+            os.path.getsize(os.path.join(self.output_folder, 'dummy_10KB.data')),
+            len(self.input_maps['dummy_10KB.data']),
+            "The file should be received even if it can not be verified.",
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.usefixtures('transfer_folders')
+    async def test_file_transfer_interrupted(self) -> None:
+        """
+        Test that closing the edge during a transfer discards the partial file.
+
+        The producer sends the first block of a file that never ends, then closes
+        the connection. The consumer must close and remove the partial file and
+        forget the transfer.
+        """
+        producer, consumer = await self.streamer_pair(
+            'topicF',
+            producer_kwargs={'chunk_size': 1024, 'read_ahead': 4},
+            consumer_kwargs={
+                'allow_incoming_files': True,
+                'destination_folder': self.output_folder,
+                'chunk_size': 1024,
+                'read_ahead': 2,
+            },
+        )
+
+        class StalledFile:
+            name = 'stalled.data'
+            blocks = 0
 
-        await asyncio.sleep(1)
-        await consumer.stop()
-        await producer.stop()
+            async def read(self, size: int) -> bytes:
+                self.blocks += 1
+                if self.blocks == 1:
+                    return bytes(size)
+                await asyncio.Event().wait()
+
+        path = os.path.join(self.output_folder, StalledFile.name)
+        push = asyncio.create_task(producer.push_file('topicF', StalledFile()))
+
+        async def until(condition) -> None:
+            while not condition():
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(until(lambda: os.path.exists(path)), timeout=5)
+        self.assertEqual(len(consumer.incoming_files), 1)
+
+        await producer.close_connection(producer.edges[0])
+        # The transfer is forgotten first, the file is removed in a worker thread
+        await asyncio.wait_for(until(lambda: not os.path.exists(path)), timeout=5)
+        self.assertFalse(consumer.incoming_files)
+
+        push.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await push
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.slow
+    @pytest.mark.tcp
+    @pytest.mark.usefixtures('transfer_folders')
+    async def test_large_file_transfer(self) -> None:
+        """
+        Test the transfer of a 100MB file between a producer and a consumer.
+
+        Deselected by default, run it with `pytest -m slow`.
+        """
+        await self.transfer_files(['dummy_100MB.data'])
 
     # ----------------------------------------------------------------------
+    @pytest.mark.usefixtures('transfer_folders')
     async def test_file_dissable_transfer(self) -> None:
         """
         Test the file transfer functionality when the consumer has file transfer disabled.
@@ -169,48 +402,28 @@ class TestStreamer(unittest.IsolatedAsyncioTestCase):
             If the file transfer does not fail as expected.
         """
 
-        producer = ChaskiStreamer(
-            # port=8515,
-            name='Producer',
-            subscriptions=['topicF'],
-            reconnections=None,
-            #
-            # File transfer
-            allow_incoming_files=True,
-            destination_folder=os.path.join('testdir', 'output'),
-        )
-
-        consumer = ChaskiStreamer(
-            # port=8516,
-            name='Consumer',
-            subscriptions=['topicF'],
-            reconnections=None,
-            #
-            # File transfer
-            allow_incoming_files=False,
-            destination_folder=os.path.join('testdir', 'output'),
+        producer, consumer = await self.streamer_pair(
+            'topicF',
+            producer_kwargs={
+                'allow_incoming_files': True,
+                'destination_folder': self.output_folder,
+            },
+            consumer_kwargs={
+                'allow_incoming_files': False,
+                'destination_folder': self.output_folder,
+            },
         )
 
-        await asyncio.sleep(0.3)
-        await producer.connect(consumer.address)
-        await asyncio.sleep(0.3)
-
         filename = 'dummy_1KB.data'
 
-        if os.path.exists(os.path.join('testdir', 'output', filename)):
-            os.remove(os.path.join('testdir', 'output', filename))
-
-        with open(os.path.join('testdir', 'input', filename), 'rb') as file:
+        with open(os.path.join(self.input_folder, filename), 'rb') as file:
             await producer.push_file('topicF', file)
 
         await asyncio.sleep(0.5)
         self.assertFalse(
-            os.path.exists(os.path.join('testdir', 'output', filename)),
+            os.path.exists(os.path.join(self.output_folder, filename)),
             'File transfer should fail as consumer has file transfer disabled',
         )
-        await asyncio.sleep(1)
-        await consumer.stop()
-        await producer.stop()
 
     # ----------------------------------------------------------------------
     async def test_stream_chain(self) -> None:
@@ -229,88 +442,39 @@ class TestStreamer(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If the received data at the final consumer does not match the expected values.
         """
-        chain0 = ChaskiStreamer(
-            # port=65440,
-            name='Producer',
-            subscriptions=['topic1'],
-            reconnections=None,
-        )
-
-        chain1 = ChaskiStreamer(
-            # port=65441,
-            name='Producer',
-            subscriptions=['topic1'],
-            reconnections=None,
-        )
-
-        chain2 = ChaskiStreamer(
-            # port=65434,
-            name='Producer',
-            subscriptions=['topic1'],
-            reconnections=None,
-        )
-
-        chain3 = ChaskiStreamer(
-            # port=65435,
-            name='Producer',
-            subscriptions=['topic1'],
-            reconnections=None,
-        )
+        chain = [
+            ChaskiStreamer(
+                name='Producer',
+                subscriptions=['topic1'],
+                reconnections=None,
+                transport=self.transport,
+            )
+            for _ in range(6)
+        ]
+        chain0, chain5 = chain[0], chain[-1]
 
-        chain4 = ChaskiStreamer(
-            # port=65436,
-            name='Producer',
-            subscriptions=['topic1'],
-            reconnections=None,
+        await asyncio.gather(*(node.serving_event.wait() for node in chain))
+        await asyncio.gather(
+            *(node.connect(next_node.address) for node, next_node in zip(chain, chain[1:]))
         )
-
-        chain5 = ChaskiStreamer(
-            # port=65437,
-            name='Producer',
-            subscriptions=['topic1'],
-            reconnections=None,
+        await asyncio.gather(
+            *(node.wait_connected(next_node) for node, next_node in zip(chain, chain[1:]))
         )
 
-        await asyncio.sleep(0.3)
-        await chain0.connect(chain1.address)
-        await chain1.connect(chain2.address)
-        await chain2.connect(chain3.address)
-        await chain3.connect(chain4.address)
-        await chain4.connect(chain5.address)
-
-        await asyncio.sleep(0.3)
-        await chain0.push(
+        await chain0.push_batch(
             'topic1',
-            {
-                'data': 'test0',
-            },
+            [{'data': f'test{count}'} for count in range(6)],
         )
 
-        count = 0
-        async with chain5 as message_queue:
-            async for incoming_message in message_queue:
-
-                self.assertEqual(f'test{count}', incoming_message.data['data'])
-
-                if count >= 5:
-                    chain5.terminate_stream()
-                    break
-
-                count += 1
-                await chain0.push(
-                    'topic1',
-                    {
-                        'data': f'test{count}',
-                    },
-                )
+        # The queue exists since the streamer was created, read it directly
+        for count in range(6):
+            incoming_message = await asyncio.wait_for(
+                chain5.message_queue.get(), timeout=5
+            )
+            self.assertEqual(f'test{count}', incoming_message.data['data'])
 
-        await asyncio.sleep(1)
-        await chain0.stop()
-        await chain1.stop()
-        await chain2.stop()
-        await chain3.stop()
-        await chain4.stop()
-        await chain5.stop()
+        await asyncio.gather(*(node.drain() for node in chain))
+        await asyncio.gather(*(node.stop() for node in chain))
 
     # ----------------------------------------------------------------------
     async def test_root_node(self) -> None:
@@ -330,32 +494,38 @@ class TestStreamer(unittest.IsolatedAsyncioTestCase):
             If the received data at the final consumer does not match the expected values.
         """
         chain0 = ChaskiStreamer(
-            # port=65440,
             name='Producer 1',
             root=True,
             paired=True,
             reconnections=None,
+            transport=self.transport,
         )
 
         chain1 = ChaskiStreamer(
-            # port=65441,
             name='Producer 2',
             subscriptions=['topic1'],
             reconnections=None,
+            transport=self.transport,
         )
 
         chain2 = ChaskiStreamer(
-            # port=65442,
             name='Producer 3',
             subscriptions=['topic1'],
             reconnections=None,
+            transport=self.transport,
         )
 
-        await asyncio.sleep(0.3)
-        await chain1.connect(chain0.address)
-        await chain2.connect(chain0.address)
+        await chain0.serving_event.wait()
+        await asyncio.gather(
+            chain1.connect(chain0.address),
+            chain2.connect(chain0.address),
+        )
+        await asyncio.gather(
+            chain0.wait_connected(chain1),
+            chain0.wait_connected(chain2),
+            chain1.wait_connected(chain0),
+        )
 
-        await asyncio.sleep(0.3)
         await chain1.push(
             'topic1',
             {
@@ -363,28 +533,23 @@ class TestStreamer(unittest.IsolatedAsyncioTestCase):
             },
         )
 
-        count = 0
-        async with chain2 as message_queue:
-            async for incoming_message in message_queue:
-
-                self.assertEqual(f'test{count}', incoming_message.data['data'])
-
-                if count >= 5:
-                    chain2.terminate_stream()
-                    break
+        # The queue exists since the streamer was created, read it directly
+        for count in range(6):
+            incoming_message = await asyncio.wait_for(
+                chain2.message_queue.get(), timeout=5
+            )
+            self.assertEqual(f'test{count}', incoming_message.data['data'])
 
-                count += 1
+            if count < 5:
                 await chain0.push(
                     'topic1',
                     {
-                        'data': f'test{count}',
+                        'data': f'test{count + 1}',
                     },
                 )
 
-        await asyncio.sleep(1)
-        await chain1.stop()
-        await chain2.stop()
-        await chain0.stop()
+        await asyncio.gather(chain0.drain(), chain1.drain(), chain2.drain())
+        await asyncio.gather(chain0.stop(), chain1.stop(), chain2.stop())
 
 
 if __name__ == '__main__':
@@ -11,16 +11,25 @@ connections correctly and can communicate effectively.
 Functions
 ---------
 - _close_nodes(nodes) : Close all instances of ChaskiNode in the provided list.
-- assertConnection(node1, node2, msg) : Assert that two ChaskiNode instances are connected.
-- assertNoConnection(node1, node2, msg) : Assert that two ChaskiNode instances are not connected.
+- _wait_topology(connected, disconnected) : Wait until the expected connections are established and closed.
+- _connected_pairs(nodes) : Collect the pairs of ChaskiNode instances connected to each other.
+- _discover(subscriptions, on_pair) : Create ChaskiNode instances around a hub and run their discovery.
+- assertConnection(pairs, node1, node2, msg) : Assert that two ChaskiNode instances are connected.
+- assertNoConnection(pairs, node1, node2, msg) : Assert that two ChaskiNode instances are not connected.
+- assertTopology(nodes, connected, disconnected) : Assert the expected connections between the nodes of a test.
 - test_single_subscription_no_disconnect() : Test single subscription connections between ChaskiNodes without disconnecting other nodes.
 - test_single_subscription_with_disconnect() : Test single subscription connections between ChaskiNodes with node disconnection during pairing.
+
+The TestSubscriptionsUnix class runs the same tests over Unix domain sockets.
 """
 
 import unittest
 import asyncio
 from typing import Optional
-from chaski.utils.auto import create_nodes
+
+import pytest
+
+from chaski.utils.auto import create_nodes, stop_nodes
 
 
 ########################################################################
@@ -34,25 +43,130 @@ class TestSubscriptions(unittest.IsolatedAsyncioTestCase):
 
     host = '127.0.0.1'
 
+    # Transport of the nodes, replaced by the `chaski_transport` fixture under pytest
+    transport = 'tcp'
+
+    # Seconds a node without a reachable partner waits before it is considered paired,
+    # a pairing over loopback completes in milliseconds
+    discovery_timeout = 1
+
     # ----------------------------------------------------------------------
     async def _close_nodes(self, nodes: list['ChaskiNode']):
         """
         Close all ChaskiNode instances in the provided list.
 
-        This method iterates through each ChaskiNode instance in the given list and
-        stops their operation by invoking the `stop` method on each node.
+        The nodes are stopped concurrently by `stop_nodes`, which waits for all of
+        them and then raises the first error of a failing `stop`. Tests register
+        it with `addAsyncCleanup` as soon as the nodes are created, so the nodes
+        are stopped even when an assertion fails.
 
         Parameters
         ----------
         nodes : list of ChaskiNode
             A list containing instances of ChaskiNode that need to be stopped.
         """
-        for node in nodes:
-            await node.stop()
+        await stop_nodes(nodes)
+
+    # ----------------------------------------------------------------------
+    async def _wait_topology(
+        self,
+        connected: list[tuple['ChaskiNode', 'ChaskiNode']],
+        disconnected: list[tuple['ChaskiNode', 'ChaskiNode']] = [],
+    ):
+        """
+        Wait until the expected connections are established and closed.
+
+        Every pair is awaited in both directions with `wait_connected` or
+        `wait_disconnected`. Timeouts are not raised, the assertions that follow
+        report the connections that did not settle.
+
+        Parameters
+        ----------
+        connected : list of tuple of ChaskiNode
+            Pairs of nodes expected to be connected to each other.
+        disconnected : list of tuple of ChaskiNode
+            Pairs of nodes expected to not be connected to each other.
+        """
+        await asyncio.gather(
+            *(
+                wait
+                for node1, node2 in connected
+                for wait in (node1.wait_connected(node2), node2.wait_connected(node1))
+            ),
+            *(
+                wait
+                for node1, node2 in disconnected
+                for wait in (
+                    node1.wait_disconnected(node2),
+                    node2.wait_disconnected(node1),
+                )
+            ),
+            return_exceptions=True,
+        )
+
+    # ----------------------------------------------------------------------
+    def _connected_pairs(self, nodes: list['ChaskiNode']) -> set[tuple]:
+        """
+        Collect the pairs of nodes connected to each other.
+
+        The edges of every node are read once, so the assertions of a test can
+        check any number of pairs, in either direction, against the same snapshot.
+
+        Parameters
+        ----------
+        nodes : list of ChaskiNode
+            The nodes of the test.
+
+        Returns
+        -------
+        set of tuple
+            The `(ip, port)` addresses of the node and the peer of every edge.
+        """
+        return {
+            ((node.ip, node.port), (edge.ip, edge.port))
+            for node in nodes
+            for edge in node.edges
+        }
+
+    # ----------------------------------------------------------------------
+    async def _discover(self, subscriptions: list, on_pair: str) -> list['ChaskiNode']:
+        """
+        Create nodes around a hub and let each of them discover its peers.
+
+        Every node but the first connects to the first one concurrently, then
+        the discovery runs one node at a time, since a node that is still
+        discovering ignores the discovery of others. Pairings complete as soon as
+        the partner connects, only nodes without a reachable partner wait for
+        `discovery_timeout`.
+
+        Parameters
+        ----------
+        subscriptions : list
+            The subscriptions of each node, as accepted by `create_nodes`.
+        on_pair : str
+            The action after pairing passed to `discovery`, 'none' or 'disconnect'.
+
+        Returns
+        -------
+        list of ChaskiNode
+            The created nodes, the first one is the hub.
+        """
+        nodes = await create_nodes(subscriptions, transport=self.transport)
+        self.addAsyncCleanup(self._close_nodes, nodes)
+        await asyncio.gather(*(node._connect_to_peer(nodes[0]) for node in nodes[1:]))
+
+        await self._wait_topology([(node, nodes[0]) for node in nodes[1:]])
+        for node in nodes[1:]:
+            await node.discovery(on_pair=on_pair, timeout=self.discovery_timeout)
+        return nodes
 
     # ----------------------------------------------------------------------
     def assertConnection(
-        self, node1: 'ChaskiNode', node2: 'ChaskiNode', msg: Optional[str] = None
+        self,
+        pairs: set[tuple],
+        node1: 'ChaskiNode',
+        node2: 'ChaskiNode',
+        msg: Optional[str] = None,
     ):
         """
         Assert that two ChaskiNodes are connected to each other.
@@ -63,6 +177,8 @@ class TestSubscriptions(unittest.IsolatedAsyncioTestCase):
 
         Parameters
         ----------
+        pairs : set of tuple
+            The connected pairs, as returned by `_connected_pairs`.
         node1 : ChaskiNode
             The first ChaskiNode to check connection from.
         node2 : ChaskiNode
@@ -76,12 +192,17 @@ class TestSubscriptions(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If `node1` is not connected to `node2` or `node2` is not connected to `node1`.
         """
-        conn = node1.is_connected_to(node2) and node2.is_connected_to(node1)
+        address1, address2 = (node1.ip, node1.port), (node2.ip, node2.port)
+        conn = (address1, address2) in pairs and (address2, address1) in pairs
         return self.assertTrue(conn, msg)
 
     # ----------------------------------------------------------------------
     def assertNoConnection(
-        self, node1: 'ChaskiNode', node2: 'ChaskiNode', msg: Optional[str] = None
+        self,
+        pairs: set[tuple],
+        node1: 'ChaskiNode',
+        node2: 'ChaskiNode',
+        msg: Optional[str] = None,
     ):
         """
         Assert that two ChaskiNodes are not connected to each other.
@@ -92,6 +213,8 @@ class TestSubscriptions(unittest.IsolatedAsyncioTestCase):
 
         Parameters
         ----------
+        pairs : set of tuple
+            The connected pairs, as returned by `_connected_pairs`.
         node1 : ChaskiNode
             The first ChaskiNode to check connection from.
         node2 : ChaskiNode
@@ -105,9 +228,50 @@ class TestSubscriptions(unittest.IsolatedAsyncioTestCase):
         AssertionError
             If `node1` is connected to `node2` or `node2` is connected to `node1`.
         """
-        conn = node1.is_connected_to(node2) and node2.is_connected_to(node1)
+        address1, address2 = (node1.ip, node1.port), (node2.ip, node2.port)
+        conn = (address1, address2) in pairs or (address2, address1) in pairs
         return self.assertFalse(conn, msg)
 
+    # ----------------------------------------------------------------------
+    async def assertTopology(
+        self,
+        nodes: list['ChaskiNode'],
+        connected: dict[tuple[int, int], str],
+        disconnected: dict[tuple[int, int], str] = {},
+    ):
+        """
+        Assert the expected connections between the nodes of a test.
+
+        The expected topology is declared once, as pairs of node indices, and is
+        used both to wait for the connections to settle and to check them against
+        a single snapshot of the edges.
+
+        Parameters
+        ----------
+        nodes : list of ChaskiNode
+            The nodes of the test.
+        connected : dict
+            The message of the assertion for every `(index, index)` pair of nodes
+            expected to be connected to each other.
+        disconnected : dict, optional
+            The message of the assertion for every `(index, index)` pair of nodes
+            expected to not be connected to each other.
+
+        Raises
+        ------
+        AssertionError
+            If any pair is not connected, or not disconnected, as expected.
+        """
+        await self._wait_topology(
+            [(nodes[i], nodes[j]) for i, j in connected],
+            [(nodes[i], nodes[j]) for i, j in disconnected],
+        )
+        pairs = self._connected_pairs(nodes)
+        for (i, j), msg in connected.items():
+            self.assertConnection(pairs, nodes[i], nodes[j], msg)
+        for (i, j), msg in disconnected.items():
+            self.assertNoConnection(pairs, nodes[i], nodes[j], msg)
+
     # ----------------------------------------------------------------------
     async def test_single_subscription_no_disconnect(self):
         """
@@ -117,8 +281,9 @@ class TestSubscriptions(unittest.IsolatedAsyncioTestCase):
         connect correctly:
 
         1. Create nodes with designated subscriptions: ['A', 'B', 'C', 'A', 'B', 'C'].
-        2. Initiate connections from each subsequent node to the first node.
-        3. Trigger a discovery phase to find and pair peers based on subscriptions.
+        2. Initiate connections from each subsequent node to the first node concurrently.
+        3. Trigger a discovery phase to find and pair peers based on subscriptions, one node
+           at a time since a node that is still discovering ignores the discovery of others.
         4. Immediately disconnect nodes after they are paired.
         5. Validate if nodes are connected based on their subscription topics.
         6. Close all node instances upon completion.
@@ -128,73 +293,55 @@ class TestSubscriptions(unittest.IsolatedAsyncioTestCase):
         AssertionError
             Raised if the nodes do not pair correctly according to their subscription topics.
         """
-        nodes = await create_nodes(['A', 'B', 'C', 'A', 'B', 'C'])
-        for node in nodes[1:]:
-            await node._connect_to_peer(nodes[0])
-
-        await asyncio.sleep(0.3)
-        for node in nodes[1:]:
-            await node.discovery(on_pair='none')
+        nodes = await self._discover(['A', 'B', 'C', 'A', 'B', 'C'], on_pair='none')
 
-        await asyncio.sleep(0.3)
-        self.assertConnection(
-            nodes[0],
-            nodes[3],
-            "Node 0 should be connected to Node 3 because both nodes are subscribed to the topic 'A'.",
+        await self.assertTopology(
+            nodes,
+            connected={
+                (0, 3): "Node 0 should be connected to Node 3 because both nodes are subscribed to the topic 'A'.",
+                (1, 4): "Node 1 should be connected to Node 4 because both nodes are subscribed to the topic 'B'.",
+                (2, 5): "Node 2 should be connected to Node 5 because both nodes are subscribed to the topic 'C'.",
+            },
         )
-        self.assertConnection(
-            nodes[1],
-            nodes[4],
-            "Node 1 should be connected to Node 4 because both nodes are subscribed to the topic 'B'.",
-        )
-        self.assertConnection(
-            nodes[2],
-            nodes[5],
-            "Node 2 should be connected to Node 5 because both nodes are subscribed to the topic 'C'.",
-        )
-
-        await self._close_nodes(nodes)
 
     # ----------------------------------------------------------------------
     async def test_single_subscription_with_disconnect(self):
         """"""
-        nodes = await create_nodes(['A', 'B', 'C', ['A', 'C'], ['B', 'A'], 'C'])
-        for node in nodes[1:]:
-            await node._connect_to_peer(nodes[0])
+        nodes = await self._discover(['A', 'B', 'C', ['A', 'C'], ['B', 'A'], 'C'], on_pair='disconnect')
 
-        await asyncio.sleep(0.3)
-        for node in nodes[1:]:
-            await node.discovery(on_pair='disconnect')
-
-        await asyncio.sleep(0.3)
-        self.assertConnection(
-            nodes[0],
-            nodes[3],
-            "Node 0 must connect to Node 3 since both are subscribed to 'A'.",
-        )
-        self.assertConnection(
-            nodes[0],
-            nodes[4],
-            "Node 0 must connect to Node 4 since they both subscribe to 'A' and 'B'.",
-        )
-        self.assertConnection(
-            nodes[1],
-            nodes[4],
-            "Node 1 must connect to Node 4 since both are subscribed to 'B'.",
-        )
-        self.assertConnection(
-            nodes[2],
-            nodes[5],
-            "Node 2 must connect to Node 5 since both are subscribed to 'C'.",
-        )
-        self.assertNoConnection(
-            nodes[0],
-            nodes[5],
-            "Node 0 must not connect to Node 5 since their subscriptions do not overlap.",
+        await self.assertTopology(
+            nodes,
+            connected={
+                (0, 3): "Node 0 must connect to Node 3 since both are subscribed to 'A'.",
+                (0, 4): "Node 0 must connect to Node 4 since they both subscribe to 'A' and 'B'.",
+                (1, 4): "Node 1 must connect to Node 4 since both are subscribed to 'B'.",
+                (2, 5): "Node 2 must connect to Node 5 since both are subscribed to 'C'.",
+            },
+            disconnected={
+                (0, 5): "Node 0 must not connect to Node 5 since their subscriptions do not overlap.",
+            },
         )
 
-        await self._close_nodes(nodes)
+
+########################################################################
+@pytest.mark.unix
+class TestSubscriptionsUnix(TestSubscriptions):
+    """
+    Test case for the subscription scenarios over Unix domain sockets.
+
+    The pairings go through the kernel socket path without the TCP handshakes
+    and checksums of the loopback interface.
+    """
+
+    transport = 'unix'
 
 
 if __name__ == '__main__':
+    # Under pytest the conftest installs uvloop, do the same when run directly
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     unittest.main()